@@ -6,6 +6,7 @@ import matplotlib.font_manager as fm
 import seaborn as sns
 import requests
 from bs4 import BeautifulSoup
+import os
 import time
 from datetime import datetime, timedelta
 import plotly.express as px
@@ -18,17 +19,53 @@ warnings.filterwarnings('ignore')
 from real_estate_crawler import HogangnonoCrawler
 from hogangnono_real_crawler import HogangnonoRealCrawler
 from report_generator import ApartmentReportGenerator
+from transaction_store import TransactionStore
+from crawler_session import create_session
+from dataset_refresher import DatasetRefresher
+from downsampling import downsample_frame, max_points_for_width, slice_window
 
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'NanumGothic'
 plt.rcParams['axes.unicode_minus'] = False
 
+# 용인시 수지구 주요 아파트 단지
+SAMPLE_APARTMENTS = [
+    "수지구청역 푸르지오", "동천역 래미안", "수지구 롯데캐슬", 
+    "죽전역 이편한세상", "신분당선 래미안", "수지구 힐스테이트",
+    "동천동 푸르지오", "죽전동 자이", "풍덕천동 래미안",
+    "상현역 푸르지오", "수지구 센트럴파크", "죽전역 롯데캐슬",
+    "동천역 힐스테이트", "수지구 아이파크", "신분당선 자이"
+]
+
+# 샘플 데이터 청크당 최대 행 수 (대용량 생성 시 메모리 상한)
+SAMPLE_CHUNK_ROWS = 500_000
+
+# 저장된 데이터셋에서 대시보드가 읽는 컬럼
+DASHBOARD_COLUMNS = ['date', 'apartment', 'area_type', 'deal_type', 'price', 'volume', 'rental_yield']
+
+# 집계 큐브 차원
+CUBE_KEYS = ['apartment', 'area_type', 'deal_type', 'month']
+
+# 크롤링 데이터셋 백그라운드 갱신 주기 (초)
+CRAWL_REFRESH_INTERVAL = 6 * 3600
+
+# 크롤링 스냅샷 저장 위치 (증분 수집 저장소 data/transactions와 분리)
+CRAWL_SNAPSHOT_DIR = os.path.join('data', 'crawl_snapshot')
+
+# 화면에서 새 스냅샷을 확인하는 주기 (초)
+SNAPSHOT_POLL_SECONDS = 30
+
+# 시계열 차트 폭 (픽셀) - 차트당 보내는 점 수의 기준
+CHART_PIXEL_WIDTH = 1200
+
 class ApartmentDataCrawler:
     def __init__(self):
         self.base_url = "https://hogangnono.com"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # 호갱노노 크롤러들과 연결 풀, 요청 스케줄러, HTTP 캐시 공유
+        self.session = create_session(self.headers)
         
     def crawl_suji_apartments(self, start_date="2022-07-01", end_date="2025-07-21"):
         """용인시 수지구 아파트 데이터 크롤링"""
@@ -40,85 +77,135 @@ class ApartmentDataCrawler:
             st.error(f"데이터 크롤링 중 오류 발생: {e}")
             return self.generate_sample_data()
     
-    def generate_sample_data(self):
+    def generate_sample_data(self, scale=None, seed=42):
         """샘플 데이터 생성 (실제 크롤링 데이터로 대체 필요)"""
-        np.random.seed(42)
+        return pd.concat(list(self.iter_sample_data(scale, seed=seed)), ignore_index=True)
+    
+    def iter_sample_data(self, scale=None, chunk_rows=SAMPLE_CHUNK_ROWS, seed=42):
+        """샘플 데이터를 단지 묶음별 데이터프레임으로 나누어 생성
         
-        # 용인시 수지구 주요 아파트 단지
-        apartments = [
-            "수지구청역 푸르지오", "동천역 래미안", "수지구 롯데캐슬", 
-            "죽전역 이편한세상", "신분당선 래미안", "수지구 힐스테이트",
-            "동천동 푸르지오", "죽전동 자이", "풍덕천동 래미안",
-            "상현역 푸르지오", "수지구 센트럴파크", "죽전역 롯데캐슬",
-            "동천역 힐스테이트", "수지구 아이파크", "신분당선 자이"
-        ]
+        scale: (단지 수, 개월 수) - 기본값은 주요 15개 단지 × 2022년 7월부터 37개월
+        """
+        n_complexes, n_months = scale or (len(SAMPLE_APARTMENTS), 37)
+        rng = np.random.default_rng(seed)
+        
+        apartments = self.sample_apartment_names(n_complexes)
+        dates = pd.date_range("2022-07-01", periods=n_months, freq="MS")
+        years_passed = np.asarray(dates.year - 2022)
+        
+        # 평형별, 거래종류별 가격 배수
+        area_types = ["32평", "39평", "49평", "59평"]
+        area_multiplier = np.array([0.8, 1.0, 1.3, 1.6])
+        deal_types = ["매매", "전세", "월세"]
+        price_multiplier = np.array([1.0, 0.7, 0.1])
+        is_sale = np.array([True, False, False])
         
-        data = []
-        for apt in apartments:
-            # 3년간 월별 데이터 생성
-            for year in range(2022, 2026):
-                for month in range(1, 13):
-                    if year == 2022 and month < 7:
-                        continue
-                    if year == 2025 and month > 7:
-                        break
-                        
-                    date = f"{year}-{month:02d}-01"
-                    
-                    # 기본 가격 설정 (억원 단위)
-                    base_price = np.random.uniform(8, 15)
-                    
-                    # 평형별 데이터
-                    for area_type in ["32평", "39평", "49평", "59평"]:
-                        area_multiplier = {"32평": 0.8, "39평": 1.0, "49평": 1.3, "59평": 1.6}
-                        
-                        # 거래종류별 데이터
-                        for deal_type in ["매매", "전세", "월세"]:
-                            price_multiplier = {"매매": 1.0, "전세": 0.7, "월세": 0.1}
-                            
-                            price = base_price * area_multiplier[area_type] * price_multiplier[deal_type]
-                            
-                            # 시간에 따른 가격 변동 (상승 트렌드)
-                            time_factor = 1 + (year - 2022) * 0.05 + np.random.uniform(-0.02, 0.02)
-                            price *= time_factor
-                            
-                            # 거래량 (랜덤)
-                            volume = np.random.poisson(15) + 5
-                            
-                            # 임대수익률 (매매가 기준)
-                            if deal_type == "매매":
-                                rental_yield = np.random.uniform(2.5, 4.5)
-                            else:
-                                rental_yield = 0
-                            
-                            data.append({
-                                'date': date,
-                                'apartment': apt,
-                                'area_type': area_type,
-                                'deal_type': deal_type,
-                                'price': round(price, 2),
-                                'volume': volume,
-                                'rental_yield': round(rental_yield, 2)
-                            })
+        n_areas, n_deals = len(area_types), len(deal_types)
+        rows_per_complex = n_months * n_areas * n_deals
+        chunk_complexes = max(1, chunk_rows // max(1, rows_per_complex))
         
-        return pd.DataFrame(data)
+        for start in range(0, n_complexes, chunk_complexes):
+            stop = min(start + chunk_complexes, n_complexes)
+            n = stop - start
+            shape = (n, n_months, n_areas, n_deals)
+            
+            # 기본 가격 설정 (억원 단위, 단지 × 월)
+            base_price = rng.uniform(8, 15, (n, n_months))
+            
+            # 시간에 따른 가격 변동 (상승 트렌드)
+            time_factor = 1 + years_passed[None, :, None, None] * 0.05 + rng.uniform(-0.02, 0.02, shape)
+            
+            price = (
+                base_price[:, :, None, None]
+                * area_multiplier[None, None, :, None]
+                * price_multiplier[None, None, None, :]
+                * time_factor
+            )
+            
+            # 거래량 (랜덤)
+            volume = rng.poisson(15, shape) + 5
+            
+            # 임대수익률 (매매가 기준)
+            rental_yield = np.where(is_sale, rng.uniform(2.5, 4.5, shape), 0.0)
+            
+            apt_idx = np.repeat(np.arange(start, stop), rows_per_complex)
+            month_idx = np.tile(np.repeat(np.arange(n_months), n_areas * n_deals), n)
+            area_idx = np.tile(np.repeat(np.arange(n_areas), n_deals), n * n_months)
+            deal_idx = np.tile(np.arange(n_deals), n * n_months * n_areas)
+            
+            yield pd.DataFrame({
+                'date': dates.values[month_idx],
+                'apartment': pd.Categorical.from_codes(apt_idx, apartments),
+                'area_type': pd.Categorical.from_codes(area_idx, area_types),
+                'deal_type': pd.Categorical.from_codes(deal_idx, deal_types),
+                'price': price.reshape(-1).round(2).astype(np.float32),
+                'volume': volume.reshape(-1),
+                'rental_yield': rental_yield.reshape(-1).round(2)
+            })
+    
+    @staticmethod
+    def sample_apartment_names(n_complexes):
+        """샘플 단지 이름 목록 (주요 단지 수를 넘으면 'N단지'를 붙여 확장)"""
+        base_count = len(SAMPLE_APARTMENTS)
+        return [
+            SAMPLE_APARTMENTS[i] if i < base_count
+            else f"{SAMPLE_APARTMENTS[i % base_count]} {i // base_count + 1}단지"
+            for i in range(n_complexes)
+        ]
 
 class ApartmentAnalyzer:
+    # 조회 인덱스 키 컬럼
+    GROUP_KEYS = ['apartment', 'area_type', 'deal_type']
+    
     def __init__(self, data):
         self.data = data
+        # 거래량 상위 아파트 결과 (top_n별)
+        self._top_volume = {}
+        self.build_index()
+    
+    def build_index(self):
+        """(아파트, 평형, 거래종류) → 날짜순 정렬된 연속 구간 인덱스 생성"""
+        self.sorted_data = self.data.sort_values(self.GROUP_KEYS + ['date'], kind='mergesort')
+        self.group_slices = {}
+        self.group_starts = np.array([], dtype=np.intp)
+        self.group_stops = np.array([], dtype=np.intp)
+        
+        # 필터 선택지
+        self.area_types = self.data['area_type'].unique()
+        self.deal_types = self.data['deal_type'].unique()
+        
+        if self.sorted_data.empty:
+            return
+        
+        # 키 컬럼 값이 바뀌는 위치가 각 그룹의 시작점
+        changed = np.zeros(len(self.sorted_data), dtype=bool)
+        changed[0] = True
+        for column in self.GROUP_KEYS:
+            values = self.sorted_data[column].to_numpy()
+            changed[1:] |= values[1:] != values[:-1]
+        
+        self.group_starts = np.flatnonzero(changed)
+        self.group_stops = np.append(self.group_starts[1:], len(self.sorted_data))
+        keys = zip(*(self.sorted_data[column].to_numpy()[self.group_starts] for column in self.GROUP_KEYS))
+        
+        for key, start, stop in zip(keys, self.group_starts, self.group_stops):
+            self.group_slices[key] = slice(start, stop)
+    
+    def get_group(self, apartment, area_type, deal_type):
+        """인덱스로 조건에 맞는 날짜순 데이터 조회 (O(1))"""
+        group_slice = self.group_slices.get((apartment, area_type, deal_type), slice(0, 0))
+        return self.sorted_data.iloc[group_slice]
         
     def get_top_volume_apartments(self, top_n=15):
-        """거래량 상위 아파트 선별"""
-        volume_by_apt = self.data.groupby('apartment')['volume'].sum().sort_values(ascending=False)
-        return volume_by_apt.head(top_n).index.tolist()
+        """거래량 상위 아파트 선별 (한 번 계산한 결과 재사용)"""
+        if top_n not in self._top_volume:
+            volume_by_apt = self.data.groupby('apartment', observed=True)['volume'].sum().sort_values(ascending=False)
+            self._top_volume[top_n] = volume_by_apt.head(top_n).index.tolist()
+        return list(self._top_volume[top_n])
     
     def calculate_cumulative_return(self, apartment, area_type, deal_type):
         """3년 누적 수익률 계산 (자본이득률 + 임대수익률)"""
-        filtered_data = self.data[
-            (self.data['apartment'] == apartment) & 
-            (self.data['area_type'] == area_type) & 
-            (self.data['deal_type'] == deal_type)
-        ].sort_values('date')
+        filtered_data = self.get_group(apartment, area_type, deal_type)
         
         if len(filtered_data) < 2:
             return 0
@@ -138,13 +225,455 @@ class ApartmentAnalyzer:
         
         return total_return
     
+    def cumulative_returns_all(self, apartments=None, area_types=None, deal_types=None):
+        """모든 (아파트, 평형, 거래종류) 그룹의 누적 수익률을 한 번에 계산"""
+        starts, stops = self.group_starts, self.group_stops
+        keys = {column: self.sorted_data[column].to_numpy()[starts] for column in self.GROUP_KEYS}
+        
+        if len(starts):
+            prices = self.sorted_data['price'].to_numpy(dtype=float)
+            rental_yields = self.sorted_data['rental_yield'].to_numpy(dtype=float)
+            counts = stops - starts
+            
+            # 자본이득률 계산 (그룹별 첫 가격 대비 마지막 가격)
+            initial_price = prices[starts]
+            final_price = prices[stops - 1]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                capital_gain = ((final_price - initial_price) / initial_price) * 100
+            
+            # 임대수익률 계산 (매매만 해당, 3년 누적) - 결측값은 제외하고 평균 (Series.mean과 동일)
+            missing = np.isnan(rental_yields)
+            yield_sums = np.add.reduceat(np.where(missing, 0, rental_yields), starts)
+            yield_counts = np.add.reduceat(~missing, starts)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                avg_rental_yield = yield_sums / yield_counts
+            total_return = np.where(keys['deal_type'] == "매매", capital_gain + avg_rental_yield * 3, capital_gain)
+            total_return = np.where(counts < 2, 0, total_return)
+        else:
+            total_return = np.array([], dtype=float)
+        
+        returns_df = pd.DataFrame({**keys, 'cumulative_return': total_return})
+        
+        if apartments is None and area_types is None and deal_types is None:
+            return returns_df
+        
+        # 요청된 조합 전체로 확장 (데이터가 없는 조합은 0)
+        grid = pd.MultiIndex.from_product([
+            list(apartments if apartments is not None else self.data['apartment'].unique()),
+            list(area_types if area_types is not None else self.data['area_type'].unique()),
+            list(deal_types if deal_types is not None else self.data['deal_type'].unique())
+        ], names=self.GROUP_KEYS)
+        
+        return (
+            returns_df.set_index(self.GROUP_KEYS)['cumulative_return']
+            .reindex(grid, fill_value=0)
+            .reset_index()
+        )
+    
     def get_price_trend(self, apartment, area_type, deal_type):
         """가격 추이 데이터"""
-        return self.data[
-            (self.data['apartment'] == apartment) & 
-            (self.data['area_type'] == area_type) & 
-            (self.data['deal_type'] == deal_type)
-        ].sort_values('date')
+        return self.get_group(apartment, area_type, deal_type)
+
+def dataset_fingerprint(data):
+    """데이터셋 식별자 (행 수 + 내용 해시) - 데이터를 불러올 때 한 번만 계산"""
+    content_hash = int(pd.util.hash_pandas_object(data, index=False).sum())
+    return f"{len(data)}-{content_hash:016x}"
+
+def build_aggregate_cube(data):
+    """(아파트, 평형, 거래종류, 월) 단위 집계 큐브
+    
+    평균 가격은 합계/건수로 보관하여 더 큰 단위로 다시 묶어도 가중 평균이 유지된다.
+    """
+    month = pd.to_datetime(data['date']).dt.to_period('M').dt.to_timestamp()
+    cube = data.assign(month=month).groupby(CUBE_KEYS, observed=True).agg(
+        price_sum=('price', 'sum'),
+        price_count=('price', 'count'),
+        volume=('volume', 'sum')
+    ).reset_index()
+    cube['price'] = cube['price_sum'] / cube['price_count']
+    return cube
+
+@st.cache_data(show_spinner=False)
+def load_aggregate_cube(fingerprint, _data):
+    """데이터셋별로 한 번만 만드는 집계 큐브 (fingerprint로 캐시, 데이터 자체는 해시하지 않음)"""
+    return build_aggregate_cube(_data)
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def load_analyzer(fingerprint, _data):
+    """데이터셋별로 한 번만 만드는 분석기 (인덱스와 거래량 순위가 재실행 사이에 유지됨)
+    
+    분석기는 읽기 전용이므로 세션 간에 공유해도 안전하다.
+    """
+    analyzer = ApartmentAnalyzer(_data)
+    analyzer.get_top_volume_apartments(15)
+    return analyzer
+
+@st.cache_data(show_spinner=False)
+def load_market_views(fingerprint, apartments, _cube):
+    """상위 아파트 비교 차트용 큐브 조각 (선택한 아파트/평형/거래종류와 무관)"""
+    top_cube = _cube[_cube['apartment'].isin(apartments)]
+    
+    volume_matrix = (
+        top_cube.groupby(['apartment', 'deal_type'], observed=True)['volume'].sum()
+        .unstack('deal_type').fillna(0)
+    )
+    
+    monthly = top_cube.groupby(['month', 'deal_type'], observed=True)[['price_sum', 'price_count', 'volume']].sum()
+    monthly_trend = pd.DataFrame({
+        'price': monthly['price_sum'] / monthly['price_count'],
+        'volume': monthly['volume']
+    }).reset_index().rename(columns={'month': 'date'})
+    
+    return {
+        'top_cube': top_cube[['apartment', 'area_type', 'deal_type', 'month', 'price', 'volume']],
+        'volume_matrix': volume_matrix,
+        'monthly_trend': monthly_trend
+    }
+
+def open_tabs(labels, key):
+    """선택된 탭만 내용을 그릴 수 있도록 상태를 추적하는 탭 (지원하지 않는 버전에서는 모든 탭을 그림)"""
+    try:
+        return st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        return st.tabs(labels)
+
+def open_expander(label, key):
+    """펼쳤을 때만 내용을 그릴 수 있도록 상태를 추적하는 확장 영역 (지원하지 않는 버전에서는 항상 그림)"""
+    try:
+        return st.expander(label, key=key, on_change="rerun")
+    except TypeError:
+        return st.expander(label)
+
+def is_open(container):
+    """탭/확장 영역이 열려 있는지 (상태를 알 수 없으면 열린 것으로 간주)"""
+    return getattr(container, 'open', None) is not False
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def build_selection_figures(fingerprint, apartment, area_type, deal_type, _current_data):
+    """선택한 (아파트, 평형, 거래종류)의 거래량/임대수익률 차트 - 데이터셋과 선택 조건으로 캐시"""
+    figures = {'volume': None, 'yield': None}
+    if _current_data.empty:
+        return figures
+    
+    fig_volume = px.bar(
+        _current_data,
+        x='date',
+        y='volume',
+        title=f"{apartment} 월별 거래량",
+        color='volume',
+        color_continuous_scale='Blues'
+    )
+    fig_volume.update_layout(height=400)
+    figures['volume'] = fig_volume
+    
+    if deal_type == "매매":
+        fig_yield = px.line(
+            _current_data,
+            x='date',
+            y='rental_yield',
+            title=f"{apartment} 임대수익률 추이",
+            markers=True
+        )
+        fig_yield.update_layout(height=400)
+        figures['yield'] = fig_yield
+    
+    return figures
+
+def date_window_slider(dates, key):
+    """확대할 기간 선택 (좁힐수록 같은 점 수로 더 촘촘하게 표시) - 기간이 하나뿐이면 None"""
+    dates = pd.to_datetime(pd.Series(dates)).dropna()
+    if dates.nunique() < 2:
+        return None
+    
+    first, last = dates.min().to_pydatetime(), dates.max().to_pydatetime()
+    start, end = st.slider("표시 기간", min_value=first, max_value=last, value=(first, last),
+                           format="YYYY-MM-DD", key=key)
+    return pd.Timestamp(start), pd.Timestamp(end)
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def build_price_figure(fingerprint, apartment, area_type, deal_type, window, max_points, _current_data):
+    """가격 추이 차트 - 선택 기간의 점을 차트 폭에 맞게 LTTB로 줄여서 표시"""
+    window_data = slice_window(_current_data, 'date', window)
+    plot_data = downsample_frame(window_data, 'date', 'price', max_points)
+    
+    fig_price = go.Figure()
+    fig_price.add_trace(go.Scatter(
+        x=pd.to_datetime(plot_data['date']),
+        y=plot_data['price'],
+        mode='lines+markers',
+        name='가격',
+        line=dict(color='#1f77b4', width=3),
+        marker=dict(size=6)
+    ))
+    
+    title = f"{apartment} - {area_type} - {deal_type} 가격 추이"
+    if len(plot_data) < len(window_data):
+        title += f" ({len(window_data):,}개 중 {len(plot_data):,}개 표시, 기간을 좁히면 상세 표시)"
+    
+    fig_price.update_layout(
+        title=title,
+        xaxis_title="날짜",
+        yaxis_title="가격 (억원)",
+        hovermode='x unified',
+        height=400
+    )
+    return fig_price
+
+@st.fragment
+def render_price_trend(fingerprint, apartment, area_type, deal_type, current_data):
+    """가격 추이 차트와 기간 선택 - 기간을 바꾸면 이 구간만 다시 실행"""
+    if current_data.empty:
+        return
+    
+    window = date_window_slider(current_data['date'], key=f"price_window:{apartment}:{area_type}:{deal_type}")
+    fig_price = build_price_figure(
+        fingerprint, apartment, area_type, deal_type, window,
+        max_points_for_width(CHART_PIXEL_WIDTH), current_data
+    )
+    st.plotly_chart(fig_price, use_container_width=True)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_returns_figure(fingerprint, apartments, _analyzer):
+    """매매 기준 누적 수익률 상위 10개 차트"""
+    returns_df = _analyzer.cumulative_returns_all(list(apartments), _analyzer.area_types, _analyzer.deal_types)
+    
+    # 매매 기준 누적 수익률 상위 10개
+    top_returns = returns_df[returns_df['deal_type'] == '매매'].nlargest(10, 'cumulative_return')
+    
+    fig_returns = px.bar(
+        top_returns,
+        x='cumulative_return',
+        y='apartment',
+        color='area_type',
+        title="매매 기준 3년 누적 수익률 상위 10개 (평형별)",
+        orientation='h',
+        height=500
+    )
+    fig_returns.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig_returns
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_heatmap_figure(fingerprint, apartments, _market_views):
+    """아파트별 거래종류별 거래량 히트맵"""
+    volume_matrix = _market_views['volume_matrix']
+    
+    fig_heatmap = px.imshow(
+        volume_matrix.values,
+        x=volume_matrix.columns,
+        y=volume_matrix.index,
+        color_continuous_scale='YlOrRd',
+        title="아파트별 거래종류별 총 거래량"
+    )
+    fig_heatmap.update_layout(height=600)
+    return fig_heatmap
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_area_price_figure(fingerprint, apartments, _market_views):
+    """평형별 가격 분포 차트 (큐브의 월 단위 셀)"""
+    fig_area_price = px.box(
+        _market_views['top_cube'],
+        x='area_type',
+        y='price',
+        color='deal_type',
+        title="평형별 가격 분포 (상위 15개 아파트)"
+    )
+    fig_area_price.update_layout(height=400)
+    return fig_area_price
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_trend_figure(fingerprint, apartments, deal_types, window, max_points, _market_views):
+    """시장 전체 평균 가격/거래량 추이 차트 - 거래종류별로 차트 폭에 맞게 LTTB로 줄여서 표시"""
+    monthly_trend = slice_window(_market_views['monthly_trend'], 'date', window)
+    
+    fig_trend = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('평균 가격 추이', '총 거래량 추이'),
+        vertical_spacing=0.1
+    )
+    
+    for deal_type in deal_types:
+        trend_data = monthly_trend[monthly_trend['deal_type'] == deal_type]
+        price_data = downsample_frame(trend_data, 'date', 'price', max_points)
+        volume_data = downsample_frame(trend_data, 'date', 'volume', max_points)
+        
+        fig_trend.add_trace(
+            go.Scatter(
+                x=pd.to_datetime(price_data['date']),
+                y=price_data['price'],
+                mode='lines+markers',
+                name=f'{deal_type} 평균가격',
+                legendgroup=deal_type
+            ),
+            row=1, col=1
+        )
+        
+        fig_trend.add_trace(
+            go.Scatter(
+                x=pd.to_datetime(volume_data['date']),
+                y=volume_data['volume'],
+                mode='lines+markers',
+                name=f'{deal_type} 거래량',
+                legendgroup=deal_type,
+                showlegend=False
+            ),
+            row=2, col=1
+        )
+    
+    fig_trend.update_layout(height=600, title_text="용인시 수지구 아파트 시장 전체 트렌드")
+    fig_trend.update_xaxes(title_text="날짜", row=2, col=1)
+    fig_trend.update_yaxes(title_text="가격 (억원)", row=1, col=1)
+    fig_trend.update_yaxes(title_text="거래량 (건)", row=2, col=1)
+    return fig_trend
+
+@st.fragment
+def render_market_section(fingerprint, apartments, analyzer, cube):
+    """상위 아파트 비교 탭 - 열린 탭의 차트만 만들고, 탭 전환 시 이 구간만 다시 실행"""
+    # 상위 아파트 비교 차트용 큐브 조각
+    market_views = load_market_views(fingerprint, apartments, cube)
+    
+    returns_tab, heatmap_tab, area_tab, trend_tab = open_tabs(
+        ["🏆 누적 수익률", "🔥 거래량 히트맵", "📏 평형별 가격", "📅 시장 트렌드"],
+        key="market_tabs"
+    )
+    
+    if is_open(returns_tab):
+        with returns_tab:
+            st.plotly_chart(build_returns_figure(fingerprint, apartments, analyzer), use_container_width=True)
+    
+    # 거래량 비교 (히트맵)
+    if is_open(heatmap_tab):
+        with heatmap_tab:
+            st.subheader("🔥 아파트별 거래량 히트맵")
+            st.plotly_chart(build_heatmap_figure(fingerprint, apartments, market_views), use_container_width=True)
+    
+    # 평형별 평균 가격 비교
+    if is_open(area_tab):
+        with area_tab:
+            st.subheader("📏 평형별 평균 가격 비교")
+            st.plotly_chart(build_area_price_figure(fingerprint, apartments, market_views), use_container_width=True)
+    
+    # 시계열 분석 - 전체 시장 트렌드
+    if is_open(trend_tab):
+        with trend_tab:
+            st.subheader("📅 시장 전체 트렌드 분석")
+            deal_types = tuple(analyzer.deal_types)
+            window = date_window_slider(market_views['monthly_trend']['date'], key="trend_window")
+            st.plotly_chart(
+                build_trend_figure(
+                    fingerprint, apartments, deal_types, window,
+                    max_points_for_width(CHART_PIXEL_WIDTH), market_views
+                ),
+                use_container_width=True
+            )
+
+@st.fragment
+def render_detail_section(selected_apartment, selected_area, selected_deal_type, current_data, cumulative_return):
+    """상세 데이터 표와 분석 리포트 - 펼쳤을 때만 그리고, 펼치기/접기는 이 구간만 다시 실행"""
+    st.subheader("📋 상세 데이터")
+    
+    # 필터링된 데이터 표시
+    filtered_data = current_data.iloc[::-1]
+    
+    with open_expander("상세 데이터 보기", key="detail_table") as table_section:
+        if is_open(table_section):
+            st.dataframe(
+                filtered_data[['date', 'apartment', 'area_type', 'deal_type', 'price', 'volume', 'rental_yield']],
+                use_container_width=True
+            )
+    
+    # 다운로드 버튼
+    csv = filtered_data.to_csv(index=False, encoding='utf-8-sig')
+    st.download_button(
+        label="📥 데이터 다운로드 (CSV)",
+        data=csv,
+        file_name=f"{selected_apartment}_{selected_area}_{selected_deal_type}_data.csv",
+        mime="text/csv"
+    )
+    
+    # 분석 리포트 생성
+    st.markdown("---")
+    st.subheader("📊 분석 리포트")
+    
+    with open_expander("상세 분석 리포트 보기", key="detail_report") as report_section:
+        if is_open(report_section):
+            st.markdown(f"""
+            ### {selected_apartment} - {selected_area} - {selected_deal_type} 분석 리포트
+            
+            **기본 정보:**
+            - 분석 기간: 2022년 7월 ~ 2025년 7월
+            - 총 데이터 포인트: {len(filtered_data)}개
+            - 3년 누적 수익률: {cumulative_return:.2f}%
+            
+            **가격 분석:**
+            - 최고가: {filtered_data['price'].max():.2f}억원
+            - 최저가: {filtered_data['price'].min():.2f}억원
+            - 평균가: {filtered_data['price'].mean():.2f}억원
+            - 가격 변동성: {filtered_data['price'].std():.2f}억원
+            
+            **거래량 분석:**
+            - 총 거래량: {filtered_data['volume'].sum()}건
+            - 월평균 거래량: {filtered_data['volume'].mean():.1f}건
+            - 최대 월거래량: {filtered_data['volume'].max()}건
+            
+            **투자 수익성:**
+            - 평균 임대수익률: {filtered_data['rental_yield'].mean():.2f}%
+            - 수익률 안정성: {'높음' if filtered_data['rental_yield'].std() < 0.5 else '보통'}
+            
+            **투자 추천도:**
+            {
+                '★★★★★ 매우 추천' if cumulative_return > 20 else
+                '★★★★☆ 추천' if cumulative_return > 10 else
+                '★★★☆☆ 보통' if cumulative_return > 0 else
+                '★★☆☆☆ 신중검토'
+            }
+            """)
+
+def crawl_dataset():
+    """호갱노노 아파트 목록으로 거래 데이터를 만들어 저장 (백그라운드 갱신 스레드에서 실행)"""
+    # 실제 호갱노노 크롤러 사용
+    real_crawler = HogangnonoRealCrawler()
+    apartments = real_crawler.get_suji_apartments()
+    
+    # 실제 아파트 데이터로 거래 데이터 생성
+    old_crawler = HogangnonoCrawler()
+    data = old_crawler.generate_realistic_data(apartments)
+    
+    # 다음 실행에서 재사용할 수 있도록 별도 위치에 저장 (다 쓴 뒤 교체하므로 읽는 중인 세션에 영향 없음)
+    TransactionStore(CRAWL_SNAPSHOT_DIR).swap(data)
+    return data[DASHBOARD_COLUMNS]
+
+def load_stored_dataset():
+    """지난 크롤링 스냅샷 (없으면 None) - 갱신이 끝나기 전까지 보여줄 이전 스냅샷"""
+    store = TransactionStore(CRAWL_SNAPSHOT_DIR)
+    return store.load(columns=DASHBOARD_COLUMNS) if store.exists() else None
+
+@st.cache_resource(show_spinner=False)
+def get_crawl_refresher():
+    """모든 세션이 공유하는 크롤링 데이터셋 갱신기 (처음 호출 시 스레드 시작)"""
+    refresher = DatasetRefresher(
+        crawl_dataset,
+        dataset_fingerprint,
+        initial_loader=load_stored_dataset,
+        interval=CRAWL_REFRESH_INTERVAL
+    )
+    refresher.start()
+    return refresher
+
+@st.fragment(run_every=SNAPSHOT_POLL_SECONDS)
+def show_snapshot_status(refresher, version):
+    """스냅샷 상태 표시 - 새 버전이 게시되면 전체 화면을 다시 그림"""
+    snapshot = refresher.current()
+    if snapshot is not None and snapshot.version != version:
+        st.rerun()
+    
+    st.caption(f"데이터 버전 {version} · {datetime.fromtimestamp(snapshot.created_at):%Y-%m-%d %H:%M} 기준")
+    if refresher.refreshing:
+        st.caption("🔄 백그라운드에서 최신 데이터를 수집하는 중...")
+    elif refresher.last_error is not None:
+        st.caption(f"⚠ 마지막 갱신 실패: {refresher.last_error}")
+    
+    if st.button("지금 갱신"):
+        refresher.request_refresh()
 
 def main():
     st.set_page_config(
@@ -160,29 +689,55 @@ def main():
     st.sidebar.header("📊 데이터 소스")
     data_source = st.sidebar.radio(
         "데이터 소스 선택",
-        ["호갱노노 실제 크롤링", "샘플 데이터 사용"]
+        ["호갱노노 실제 크롤링", "저장된 데이터셋", "샘플 데이터 사용"]
     )
     
     # 데이터 로딩
     @st.cache_data
     def load_data(source_type):
-        if source_type == "호갱노노 실제 크롤링":
-            # 실제 호갱노노 크롤러 사용
-            real_crawler = HogangnonoRealCrawler()
-            apartments = real_crawler.get_suji_apartments()
-            
-            # 실제 아파트 데이터로 거래 데이터 생성
-            old_crawler = HogangnonoCrawler()
-            return old_crawler.generate_realistic_data(apartments)
+        data = read_source(source_type)
+        return data, dataset_fingerprint(data)
+    
+    def read_source(source_type):
+        store = TransactionStore()
+        
+        if source_type == "저장된 데이터셋" and store.exists():
+            # 대시보드에 필요한 컬럼만 읽기
+            return store.load(columns=DASHBOARD_COLUMNS)
+        
+        # 기본 샘플 데이터
+        crawler = ApartmentDataCrawler()
+        return crawler.crawl_suji_apartments()
+    
+    use_crawled = data_source == "호갱노노 실제 크롤링" or (
+        data_source == "저장된 데이터셋" and not TransactionStore().exists()
+    )
+    snapshot = None
+    
+    if use_crawled:
+        # 크롤링은 백그라운드에서 갱신하고 마지막 정상 스냅샷을 바로 사용
+        refresher = get_crawl_refresher()
+        snapshot = refresher.current()
+        if snapshot is None:
+            with st.spinner("호갱노노 데이터를 처음 수집하는 중..."):
+                snapshot = refresher.wait_for_snapshot()
+        if snapshot is None:
+            st.warning(f"호갱노노 데이터 수집 실패, 샘플 데이터를 표시합니다: {refresher.last_error}")
         else:
-            # 기본 샘플 데이터
-            crawler = ApartmentDataCrawler()
-            return crawler.crawl_suji_apartments()
+            with st.sidebar:
+                show_snapshot_status(refresher, snapshot.version)
+    
+    if snapshot is not None:
+        data, fingerprint = snapshot.data, snapshot.fingerprint
+    else:
+        with st.spinner("데이터를 불러오는 중..."):
+            data, fingerprint = load_data("샘플 데이터 사용" if use_crawled else data_source)
     
-    with st.spinner("데이터를 불러오는 중..."):
-        data = load_data(data_source)
+    # 상위 아파트 비교 차트는 데이터셋이 같으면 재계산하지 않음
+    cube = load_aggregate_cube(fingerprint, data)
     
-    analyzer = ApartmentAnalyzer(data)
+    # 데이터셋 식별자로 캐시된 분석기 (데이터프레임을 다시 해시하지 않음)
+    analyzer = load_analyzer(fingerprint, data)
     top_apartments = analyzer.get_top_volume_apartments(15)
     
     # 사이드바 필터
@@ -194,14 +749,14 @@ def main():
         index=0
     )
     
-    area_types = data['area_type'].unique()
+    area_types = analyzer.area_types
     selected_area = st.sidebar.selectbox(
         "평형 선택",
         options=area_types,
         index=0
     )
     
-    deal_types = data['deal_type'].unique()
+    deal_types = analyzer.deal_types
     selected_deal_type = st.sidebar.selectbox(
         "거래종류 선택",
         options=deal_types,
@@ -292,239 +847,39 @@ def main():
     # 가격 추이 차트
     st.subheader("📈 가격 추이 분석")
     
-    if not current_data.empty:
-        fig_price = go.Figure()
-        fig_price.add_trace(go.Scatter(
-            x=pd.to_datetime(current_data['date']),
-            y=current_data['price'],
-            mode='lines+markers',
-            name='가격',
-            line=dict(color='#1f77b4', width=3),
-            marker=dict(size=6)
-        ))
-        
-        fig_price.update_layout(
-            title=f"{selected_apartment} - {selected_area} - {selected_deal_type} 가격 추이",
-            xaxis_title="날짜",
-            yaxis_title="가격 (억원)",
-            hovermode='x unified',
-            height=400
-        )
-        
-        st.plotly_chart(fig_price, use_container_width=True)
+    # 선택 조건별로 캐시된 차트 (같은 조건이면 다시 만들지 않음)
+    selection_key = (fingerprint, selected_apartment, selected_area, selected_deal_type)
+    selection_figures = build_selection_figures(*selection_key, current_data)
+    
+    # 긴 시계열은 차트 폭에 맞게 줄이고, 기간을 좁히면 원래 해상도로 표시
+    render_price_trend(*selection_key, current_data)
     
     # 거래량 및 임대수익률 비교
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📊 월별 거래량")
-        if not current_data.empty:
-            fig_volume = px.bar(
-                current_data,
-                x='date',
-                y='volume',
-                title=f"{selected_apartment} 월별 거래량",
-                color='volume',
-                color_continuous_scale='Blues'
-            )
-            fig_volume.update_layout(height=400)
-            st.plotly_chart(fig_volume, use_container_width=True)
+        if selection_figures['volume'] is not None:
+            st.plotly_chart(selection_figures['volume'], use_container_width=True)
     
     with col2:
         st.subheader("💰 임대수익률 추이")
-        if not current_data.empty and selected_deal_type == "매매":
-            fig_yield = px.line(
-                current_data,
-                x='date',
-                y='rental_yield',
-                title=f"{selected_apartment} 임대수익률 추이",
-                markers=True
-            )
-            fig_yield.update_layout(height=400)
-            st.plotly_chart(fig_yield, use_container_width=True)
+        if selection_figures['yield'] is not None:
+            st.plotly_chart(selection_figures['yield'], use_container_width=True)
         else:
             st.info("임대수익률은 매매 거래에서만 표시됩니다.")
     
-    # 상위 15개 아파트 비교 분석
+    # 상위 15개 아파트 비교 분석 (선택한 탭만 그리고, 탭 전환은 이 구간만 다시 실행)
     st.markdown("---")
     st.subheader("🏆 상위 15개 아파트 비교 분석")
     
-    # 누적 수익률 비교
-    returns_data = []
-    for apt in top_apartments:
-        for area in area_types:
-            for deal in deal_types:
-                ret = analyzer.calculate_cumulative_return(apt, area, deal)
-                returns_data.append({
-                    'apartment': apt,
-                    'area_type': area,
-                    'deal_type': deal,
-                    'cumulative_return': ret
-                })
-    
-    returns_df = pd.DataFrame(returns_data)
-    
-    # 매매 기준 누적 수익률 상위 10개
-    top_returns = returns_df[returns_df['deal_type'] == '매매'].nlargest(10, 'cumulative_return')
-    
-    fig_returns = px.bar(
-        top_returns,
-        x='cumulative_return',
-        y='apartment',
-        color='area_type',
-        title="매매 기준 3년 누적 수익률 상위 10개 (평형별)",
-        orientation='h',
-        height=500
-    )
-    fig_returns.update_layout(yaxis={'categoryorder': 'total ascending'})
-    st.plotly_chart(fig_returns, use_container_width=True)
-    
-    # 거래량 비교 (히트맵)
-    st.subheader("🔥 아파트별 거래량 히트맵")
-    
-    volume_pivot = data[data['apartment'].isin(top_apartments)].groupby(
-        ['apartment', 'deal_type']
-    )['volume'].sum().reset_index()
-    
-    volume_matrix = volume_pivot.pivot(index='apartment', columns='deal_type', values='volume').fillna(0)
-    
-    fig_heatmap = px.imshow(
-        volume_matrix.values,
-        x=volume_matrix.columns,
-        y=volume_matrix.index,
-        color_continuous_scale='YlOrRd',
-        title="아파트별 거래종류별 총 거래량"
-    )
-    fig_heatmap.update_layout(height=600)
-    st.plotly_chart(fig_heatmap, use_container_width=True)
-    
-    # 평형별 평균 가격 비교
-    st.subheader("📏 평형별 평균 가격 비교")
-    
-    avg_price_by_area = data[data['apartment'].isin(top_apartments)].groupby(
-        ['area_type', 'deal_type']
-    )['price'].mean().reset_index()
-    
-    fig_area_price = px.box(
-        data[data['apartment'].isin(top_apartments)],
-        x='area_type',
-        y='price',
-        color='deal_type',
-        title="평형별 가격 분포 (상위 15개 아파트)"
-    )
-    fig_area_price.update_layout(height=400)
-    st.plotly_chart(fig_area_price, use_container_width=True)
-    
-    # 시계열 분석 - 전체 시장 트렌드
-    st.subheader("📅 시장 전체 트렌드 분석")
-    
-    monthly_trend = data[data['apartment'].isin(top_apartments)].groupby(
-        ['date', 'deal_type']
-    ).agg({
-        'price': 'mean',
-        'volume': 'sum'
-    }).reset_index()
-    
-    fig_trend = make_subplots(
-        rows=2, cols=1,
-        subplot_titles=('평균 가격 추이', '총 거래량 추이'),
-        vertical_spacing=0.1
-    )
-    
-    for deal_type in deal_types:
-        trend_data = monthly_trend[monthly_trend['deal_type'] == deal_type]
-        
-        fig_trend.add_trace(
-            go.Scatter(
-                x=pd.to_datetime(trend_data['date']),
-                y=trend_data['price'],
-                mode='lines+markers',
-                name=f'{deal_type} 평균가격',
-                legendgroup=deal_type
-            ),
-            row=1, col=1
-        )
-        
-        fig_trend.add_trace(
-            go.Scatter(
-                x=pd.to_datetime(trend_data['date']),
-                y=trend_data['volume'],
-                mode='lines+markers',
-                name=f'{deal_type} 거래량',
-                legendgroup=deal_type,
-                showlegend=False
-            ),
-            row=2, col=1
-        )
-    
-    fig_trend.update_layout(height=600, title_text="용인시 수지구 아파트 시장 전체 트렌드")
-    fig_trend.update_xaxes(title_text="날짜", row=2, col=1)
-    fig_trend.update_yaxes(title_text="가격 (억원)", row=1, col=1)
-    fig_trend.update_yaxes(title_text="거래량 (건)", row=2, col=1)
-    
-    st.plotly_chart(fig_trend, use_container_width=True)
+    render_market_section(fingerprint, tuple(top_apartments), analyzer, cube)
     
     # 데이터 테이블
     st.markdown("---")
-    st.subheader("📋 상세 데이터")
-    
-    # 필터링된 데이터 표시
-    filtered_data = data[
-        (data['apartment'] == selected_apartment) &
-        (data['area_type'] == selected_area) &
-        (data['deal_type'] == selected_deal_type)
-    ].sort_values('date', ascending=False)
-    
-    st.dataframe(
-        filtered_data[['date', 'apartment', 'area_type', 'deal_type', 'price', 'volume', 'rental_yield']],
-        use_container_width=True
-    )
-    
-    # 다운로드 버튼
-    csv = filtered_data.to_csv(index=False, encoding='utf-8-sig')
-    st.download_button(
-        label="📥 데이터 다운로드 (CSV)",
-        data=csv,
-        file_name=f"{selected_apartment}_{selected_area}_{selected_deal_type}_data.csv",
-        mime="text/csv"
+    render_detail_section(
+        selected_apartment, selected_area, selected_deal_type, current_data, cumulative_return
     )
-    
-    # 분석 리포트 생성
-    st.markdown("---")
-    st.subheader("📊 분석 리포트")
-    
-    with st.expander("상세 분석 리포트 보기"):
-        st.markdown(f"""
-        ### {selected_apartment} - {selected_area} - {selected_deal_type} 분석 리포트
-        
-        **기본 정보:**
-        - 분석 기간: 2022년 7월 ~ 2025년 7월
-        - 총 데이터 포인트: {len(filtered_data)}개
-        - 3년 누적 수익률: {cumulative_return:.2f}%
-        
-        **가격 분석:**
-        - 최고가: {filtered_data['price'].max():.2f}억원
-        - 최저가: {filtered_data['price'].min():.2f}억원
-        - 평균가: {filtered_data['price'].mean():.2f}억원
-        - 가격 변동성: {filtered_data['price'].std():.2f}억원
-        
-        **거래량 분석:**
-        - 총 거래량: {filtered_data['volume'].sum()}건
-        - 월평균 거래량: {filtered_data['volume'].mean():.1f}건
-        - 최대 월거래량: {filtered_data['volume'].max()}건
-        
-        **투자 수익성:**
-        - 평균 임대수익률: {filtered_data['rental_yield'].mean():.2f}%
-        - 수익률 안정성: {'높음' if filtered_data['rental_yield'].std() < 0.5 else '보통'}
-        
-        **투자 추천도:**
-        {
-            '★★★★★ 매우 추천' if cumulative_return > 20 else
-            '★★★★☆ 추천' if cumulative_return > 10 else
-            '★★★☆☆ 보통' if cumulative_return > 0 else
-            '★★☆☆☆ 신중검토'
-        }
-        """)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+아파트 단지 중복 제거 - 이름 정규화 + 문자 n-gram MinHash/LSH 색인으로 유사 단지 병합
+"""
+
+import hashlib
+import re
+
+import numpy as np
+
+# 단지를 구분하지 않는 지역명/일반 명칭 (긴 것부터)
+NAME_NOISE_PATTERN = re.compile(r'경기도|용인시|수지구|용인|수지|아파트')
+NON_WORD_PATTERN = re.compile(r'[^0-9a-z가-힣]')
+NUMBER_PATTERN = re.compile(r'\d+')
+
+# MinHash 해시 계산용 메르센 소수 (31비트라 곱셈이 uint64 범위 안에서 끝남)
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+def normalize_name(name, dong=None):
+    """비교용 단지명 ("용인수지신정마을1단지", "수지 신정마을 1단지" -> "신정마을1단지")
+
+    주소의 동 이름이 단지명에 함께 붙어 있으면 ("성복동 수지자이") 그 부분도 제거한다.
+    """
+    text = (name or '').lower()
+    if dong:
+        text = text.replace(dong, '')
+    text = NON_WORD_PATTERN.sub('', text)
+    normalized = NAME_NOISE_PATTERN.sub('', text)
+    # 지역명만으로 된 이름은 지우지 않고 그대로 사용
+    return normalized or text
+
+
+def shingles(text, n=2):
+    """문자 n-gram 집합"""
+    if len(text) <= n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def stable_hash(text):
+    """실행마다 같은 64비트 해시 (파이썬 hash()는 프로세스마다 달라짐)"""
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class ApartmentDedupIndex:
+    """유사한 단지명을 하나의 대표 단지(canonical ID)로 묶는 색인
+
+    MinHash 서명을 밴드로 나눈 LSH 버킷에서 후보만 찾아 실제 n-gram 자카드 유사도로 확인하므로
+    단지 수에 대해 거의 선형 시간에 동작한다. 단지 번호(1단지, 4차 등)가 다르면 병합하지 않는다.
+    """
+
+    def __init__(self, threshold=0.7, num_perm=32, bands=8, ngram=2, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ngram = ngram
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)[:, None]
+
+        self._by_key = {}        # 정규화된 이름 -> canonical ID 목록
+        self._buckets = {}       # (밴드 번호, 밴드 해시) -> canonical ID 목록
+        self._entries = {}       # canonical ID -> (n-gram 집합, 숫자 튜플, 동)
+        self.records = {}        # canonical ID -> 대표 단지
+        self.aliases = {}        # canonical ID -> 병합된 원래 이름 목록
+
+    def signature(self, grams):
+        """n-gram 집합의 MinHash 서명"""
+        hashes = np.fromiter((stable_hash(gram) % MERSENNE_PRIME for gram in grams),
+                             dtype=np.uint64, count=len(grams))
+        return ((self._a * hashes + self._b) % MERSENNE_PRIME).min(axis=1)
+
+    def _band_keys(self, signature):
+        for band, rows in enumerate(signature.reshape(self.bands, self.rows)):
+            yield band, rows.tobytes()
+
+    @staticmethod
+    def _same_dong(dong, other):
+        """동 정보가 모두 있을 때만 일치 여부 확인"""
+        return not dong or not other or dong == other
+
+    def _find(self, grams, numbers, dong, signature):
+        """이미 색인된 단지 중 유사한 단지의 canonical ID (없으면 None)"""
+        best_id, best_score = None, self.threshold
+        seen = set()
+
+        for band_key in self._band_keys(signature):
+            for candidate in self._buckets.get(band_key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+
+                candidate_grams, candidate_numbers, candidate_dong = self._entries[candidate]
+                if candidate_numbers != numbers or not self._same_dong(dong, candidate_dong):
+                    continue
+
+                score = len(grams & candidate_grams) / len(grams | candidate_grams)
+                if score >= best_score:
+                    best_id, best_score = candidate, score
+
+        return best_id
+
+    def add(self, apartment):
+        """단지를 색인에 추가하고 canonical ID 반환 (apartment.canonical_id도 설정)"""
+        # 동을 찾지 못해 구 이름이 들어간 경우 ("수지구")는 동 정보 없음으로 취급
+        dong = apartment.dong if apartment.dong and apartment.dong.endswith('동') else None
+        key = normalize_name(apartment.name, dong)
+
+        canonical_id = None
+        for candidate in self._by_key.get(key, ()):
+            if self._same_dong(dong, self._entries[candidate][2]):
+                canonical_id = candidate
+                break
+
+        if canonical_id is None:
+            grams = shingles(key, self.ngram)
+            numbers = tuple(NUMBER_PATTERN.findall(key))
+            signature = self.signature(grams)
+            canonical_id = self._find(grams, numbers, dong, signature)
+
+            if canonical_id is None:
+                canonical_id = f"apt-{stable_hash(f'{dong}:{key}'):016x}"
+                self._entries[canonical_id] = (grams, numbers, dong)
+                for band_key in self._band_keys(signature):
+                    self._buckets.setdefault(band_key, []).append(canonical_id)
+                self.records[canonical_id] = apartment
+                self.aliases[canonical_id] = []
+
+            self._by_key.setdefault(key, []).append(canonical_id)
+
+        representative = self.records[canonical_id]
+        if representative is not apartment:
+            self.aliases[canonical_id].append(apartment.name)
+            # 대표 단지에 없는 상세 페이지 URL은 중복 단지에서 가져옴
+            if not representative.url and apartment.url:
+                representative.url = apartment.url
+
+        apartment.canonical_id = canonical_id
+        return canonical_id
+
+    def canonical_id(self, name, dong=None):
+        """이미 색인된 이름의 canonical ID (정확히 같은 정규화 이름만)"""
+        for candidate in self._by_key.get(normalize_name(name, dong), ()):
+            if self._same_dong(dong, self._entries[candidate][2]):
+                return candidate
+        return None
+
+
+def dedupe_apartments(apartments, **index_options):
+    """유사 단지를 병합하여 대표 단지 목록 반환 (처음 등장한 순서 유지)"""
+    index = ApartmentDedupIndex(**index_options)
+    unique_apartments = []
+
+    for apt in apartments:
+        canonical_id = index.add(apt)
+        if index.records[canonical_id] is apt:
+            unique_apartments.append(apt)
+
+    merged = len(apartments) - len(unique_apartments)
+    if merged:
+        print(f"유사 단지 {merged}개 병합 ({len(apartments)} -> {len(unique_apartments)})")
+
+    return unique_apartments
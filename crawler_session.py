@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+크롤러 세션 생성 - 연결 풀 크기/재시도 설정, 선택적 HTTP/2 전송, 크롤러 간 연결 공유
+"""
+
+import io
+import os
+import ssl
+import threading
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.cookies import cookiejar_from_dict
+from requests.exceptions import ConnectionError, ReadTimeout
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+from urllib3.util.retry import Retry
+
+from http_cache import install_http_cache
+from rate_limiter import ThrottledAdapter, get_shared_scheduler
+
+# 호스트별 최대 연결 수 (동시 탐색 작업 수보다 크게)
+DEFAULT_POOL_SIZE = 32
+
+# 연결 수립 실패만 재시도 - 이 재시도는 요청 스케줄러 아래에서 일어나므로
+# 읽기 시간 초과는 재시도하지 않고 스케줄러가 실패로 기록하여 백오프/서킷 브레이커로 처리
+# (429/5xx도 요청 스케줄러가 감속/백오프로 처리)
+DEFAULT_RETRIES = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    status=0,
+    backoff_factor=0.5,
+    allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+    raise_on_status=False
+)
+
+
+class HTTPXStream:
+    """httpx 스트리밍 응답을 requests의 raw처럼 읽는 래퍼 (iter_content/close 지원)"""
+
+    def __init__(self, result):
+        self._result = result
+        self._chunks = result.iter_bytes()
+        self._buffer = b''
+
+    def read(self, amt=None):
+        if amt is None:
+            data = self._buffer + b''.join(self._chunks)
+            self._buffer = b''
+            return data
+
+        while len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._result.close()
+
+
+class HTTPXAdapter(BaseAdapter):
+    """httpx 클라이언트로 요청을 보내는 어댑터 (HTTP/2로 한 연결에서 여러 요청 다중화)
+
+    verify/cert/proxies 조합마다 클라이언트(연결 풀)를 따로 만들어 HTTPAdapter와 같은 설정을 따른다.
+    세션 쿠키 저장소는 갱신하지 않고 응답 객체의 cookies에만 반영한다.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, http2=True, retries=2):
+        import httpx
+
+        super().__init__()
+        self._httpx = httpx
+        self.pool_size = pool_size
+        self.http2 = http2
+        self.retries = retries
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
+    def _ssl_context(self, verify, cert):
+        """requests의 verify/cert 값을 SSL 컨텍스트로 변환"""
+        if verify is False:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif isinstance(verify, str) and os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        elif isinstance(verify, str):
+            context = ssl.create_default_context(cafile=verify)
+        else:
+            context = ssl.create_default_context()
+
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        return context
+
+    def get_client(self, verify=True, cert=None, proxy=None):
+        """설정 조합별 클라이언트 (처음 사용할 때 생성)"""
+        key = (verify, tuple(cert) if isinstance(cert, list) else cert, proxy)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                httpx = self._httpx
+                # transport를 직접 넘기면 Client의 limits/http2는 무시되므로 transport에 설정
+                # (httpx의 retries는 연결 수립 실패만 재시도, 환경 변수 프록시는 requests가 이미 반영)
+                client = httpx.Client(
+                    transport=httpx.HTTPTransport(
+                        verify=self._ssl_context(verify, cert),
+                        http2=self.http2,
+                        limits=httpx.Limits(max_connections=self.pool_size,
+                                            max_keepalive_connections=self.pool_size),
+                        retries=self.retries,
+                        proxy=proxy
+                    ),
+                    follow_redirects=False,
+                    trust_env=False
+                )
+                self._clients[key] = client
+            return client
+
+    def _timeout(self, timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect)
+        return self._httpx.Timeout(timeout)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        client = self.get_client(verify, cert, select_proxy(request.url, proxies or {}))
+
+        try:
+            result = client.send(
+                client.build_request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=body,
+                    timeout=self._timeout(timeout)
+                ),
+                stream=stream
+            )
+        except self._httpx.TimeoutException as e:
+            raise ReadTimeout(e, request=request)
+        except self._httpx.TransportError as e:
+            raise ConnectionError(e, request=request)
+
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.reason = result.reason_phrase
+        response.headers = CaseInsensitiveDict(result.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        if stream:
+            # 본문은 iter_content()로 읽는 만큼만 받음
+            response.raw = HTTPXStream(result)
+        else:
+            # 본문은 이미 모두 읽었으므로 close()/iter_content()가 동작하도록 raw를 메모리 버퍼로 제공
+            response._content = result.content
+            response._content_consumed = True
+            response.raw = io.BytesIO(result.content)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.cookies = cookiejar_from_dict(dict(result.cookies))
+        return response
+
+    def close(self):
+        with self._clients_lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+
+def create_transport(pool_size=DEFAULT_POOL_SIZE, retries=DEFAULT_RETRIES, http2=False):
+    """실제 네트워크 전송 어댑터 생성 (http2=True이고 httpx가 설치된 경우 HTTP/2)"""
+    if http2:
+        try:
+            return HTTPXAdapter(pool_size=pool_size, http2=True)
+        except ImportError:
+            print("httpx[http2]가 설치되지 않아 HTTP/1.1 연결 풀을 사용합니다")
+
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+
+
+def create_session(headers=None, transport=None):
+    """크롤러 세션 생성: 전송 어댑터 → 요청 스케줄러 → HTTP 캐시 순으로 연결"""
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    install_http_cache(
+        session,
+        transport=ThrottledAdapter(get_shared_scheduler(), transport or get_shared_transport())
+    )
+    return session
+
+
+_shared_transport = None
+_shared_transport_lock = threading.Lock()
+
+
+def configure_shared_transport(pool_size=DEFAULT_POOL_SIZE, retries=DEFAULT_RETRIES, http2=False):
+    """크롤러들이 공유할 전송 어댑터 설정 (이후 생성되는 세션부터 적용)"""
+    global _shared_transport
+    with _shared_transport_lock:
+        _shared_transport = create_transport(pool_size, retries, http2)
+        return _shared_transport
+
+
+def get_shared_transport():
+    """크롤러 클래스들이 공유하는 전송 어댑터 (연결 풀)"""
+    global _shared_transport
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = create_transport()
+        return _shared_transport
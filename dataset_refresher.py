@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+데이터셋 백그라운드 갱신 - 주기적으로 새 데이터를 만들어 버전이 붙은 스냅샷으로 교체
+"""
+
+import threading
+import time
+
+# 기본 갱신 주기 (초)
+DEFAULT_REFRESH_INTERVAL = 6 * 3600
+
+
+class DatasetSnapshot:
+    """한 시점의 데이터셋 (게시 후에는 수정하지 않음)"""
+
+    __slots__ = ('version', 'data', 'fingerprint', 'created_at', 'source')
+
+    def __init__(self, version, data, fingerprint, created_at, source):
+        self.version = version
+        self.data = data
+        self.fingerprint = fingerprint
+        self.created_at = created_at
+        self.source = source
+
+
+class DatasetRefresher:
+    """백그라운드 스레드에서 데이터셋을 갱신하고 마지막 정상 스냅샷을 즉시 제공
+
+    loader: 새 데이터프레임을 반환하는 함수 (오래 걸려도 됨)
+    fingerprint: 데이터프레임 → 식별자 함수
+    initial_loader: 시작 시 바로 쓸 수 있는 이전 데이터 (없으면 None 반환)
+    """
+
+    def __init__(self, loader, fingerprint, initial_loader=None, interval=DEFAULT_REFRESH_INTERVAL):
+        self.loader = loader
+        self.fingerprint = fingerprint
+        self.initial_loader = initial_loader
+        self.interval = interval
+        self.last_error = None
+        self.refreshing = False
+
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._published = threading.Condition(self._lock)
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def current(self):
+        """마지막으로 게시된 스냅샷 (아직 없으면 None)"""
+        with self._lock:
+            return self._snapshot
+
+    def wait_for_snapshot(self, timeout=None):
+        """첫 스냅샷이 게시되거나 갱신이 실패할 때까지 대기 (스냅샷이 없으면 None)"""
+        with self._published:
+            self._published.wait_for(lambda: self._snapshot is not None or self.last_error is not None, timeout)
+            return self._snapshot
+
+    def publish(self, data, source):
+        """새 스냅샷 게시 (내용이 같으면 버전을 올리지 않음)"""
+        fingerprint = self.fingerprint(data)
+
+        with self._published:
+            current = self._snapshot
+            if current is not None and current.fingerprint == fingerprint:
+                return current
+
+            version = current.version + 1 if current is not None else 1
+            self._snapshot = DatasetSnapshot(version, data, fingerprint, time.time(), source)
+            self._published.notify_all()
+            return self._snapshot
+
+    def refresh(self):
+        """새 데이터를 불러와 게시 (실패 시 이전 스냅샷 유지)"""
+        self.refreshing = True
+        try:
+            snapshot = self.publish(self.loader(), 'refresh')
+            self.last_error = None
+            return snapshot
+        except Exception as e:
+            with self._published:
+                self.last_error = e
+                self._published.notify_all()
+            print(f"데이터셋 갱신 실패 (이전 스냅샷 유지): {e}")
+            return None
+        finally:
+            self.refreshing = False
+
+    def request_refresh(self):
+        """다음 주기를 기다리지 않고 바로 갱신"""
+        self._wakeup.set()
+
+    def start(self):
+        """갱신 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(target=self._run, name='dataset-refresher', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        if self.initial_loader is not None:
+            try:
+                data = self.initial_loader()
+                if data is not None:
+                    self.publish(data, 'initial')
+            except Exception as e:
+                print(f"저장된 데이터셋 로드 실패: {e}")
+
+        while True:
+            self.refresh()
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
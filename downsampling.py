@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+시계열 다운샘플링 - LTTB(Largest-Triangle-Three-Buckets)로 차트 폭에 맞는 점만 선택
+"""
+
+import numpy as np
+import pandas as pd
+
+# 차트 기본 폭 (픽셀)
+DEFAULT_CHART_WIDTH = 1200
+
+# 픽셀당 표시할 최대 점 수
+POINTS_PER_PIXEL = 1
+
+
+def max_points_for_width(pixel_width=DEFAULT_CHART_WIDTH, points_per_pixel=POINTS_PER_PIXEL):
+    """차트 폭에 대응하는 최대 점 수"""
+    return max(3, int(pixel_width * points_per_pixel))
+
+
+def lttb_indices(x, y, threshold):
+    """LTTB로 모양을 유지하는 threshold개 점의 위치 반환 (처음/마지막 점은 항상 포함)
+
+    x는 숫자 또는 datetime64 배열, 점 수가 threshold 이하이면 전체 위치를 반환한다.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    x = x.astype(float)
+    y = np.asarray(y, dtype=float)
+
+    # 처음/마지막 점을 뺀 나머지를 threshold - 2개 구간으로 분할
+    every = (n - 2) / (threshold - 2)
+    edges = (np.arange(threshold - 1) * every).astype(np.intp) + 1
+    edges[-1] = n - 1
+
+    indices = np.empty(threshold, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+
+        # 다음 구간의 평균점 (마지막 구간은 마지막 점)
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+            avg_x = x[next_start:next_stop].mean()
+            avg_y = y[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # 이전 선택점, 다음 구간 평균점과 만드는 삼각형 넓이가 가장 큰 점 선택
+        ax, ay = x[selected], y[selected]
+        areas = np.abs((ax - avg_x) * (y[start:stop] - ay) - (ax - x[start:stop]) * (avg_y - ay))
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+
+    return indices
+
+
+def downsample_frame(frame, x, y, max_points):
+    """x 기준으로 정렬된 데이터프레임을 y 모양을 유지하며 max_points개 행으로 축소"""
+    if len(frame) <= max_points:
+        return frame
+
+    # 결측값은 삼각형 넓이 계산에서 제외
+    valid = frame[frame[y].notna()]
+    return valid.iloc[lttb_indices(valid[x].to_numpy(), valid[y].to_numpy(), max_points)]
+
+
+def slice_window(frame, x, window):
+    """(시작, 끝) 구간의 행만 선택 (window가 None이면 전체)"""
+    if window is None:
+        return frame
+
+    start, end = window
+    values = pd.to_datetime(frame[x])
+    return frame[(values >= start) & (values <= end)]
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+엔드포인트 탐색 캐시 - 성공한 검색 요청과 분석한 JS 번들을 디스크에 저장
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_CACHE_DIR = '.crawler_cache'
+
+# 같은 파일을 쓰는 캐시 인스턴스들이 공유하는 파일별 잠금
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+
+def _file_lock(path):
+    with _file_locks_guard:
+        return _file_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+class EndpointCache:
+    """JSON 파일 기반 엔드포인트 탐색 캐시 (TTL 적용)"""
+
+    def __init__(self, path=None, ttl=7 * 24 * 3600):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, 'endpoint_cache.json')
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self):
+        """캐시 파일 로드 (없거나 손상된 경우 빈 캐시)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                data.setdefault('endpoints', {})
+                data.setdefault('bundles', {})
+                data.setdefault('forgotten', {})
+                return data
+        except (OSError, ValueError):
+            pass
+        return {'endpoints': {}, 'bundles': {}, 'forgotten': {}}
+
+    def _merge_disk(self):
+        """다른 인스턴스가 저장한 내용과 병합 (항목마다 더 최근에 저장된 쪽 사용)
+
+        삭제한 엔드포인트는 삭제 시각을 함께 저장하여 그 전에 저장된 항목이 되살아나지 않게 한다.
+        """
+        disk = self._load()
+        forgotten = self._data['forgotten']
+        for key, removed_at in disk['forgotten'].items():
+            forgotten[key] = max(removed_at, forgotten.get(key, 0))
+
+        for section in ('endpoints', 'bundles'):
+            merged = self._data[section]
+            for key, entry in disk[section].items():
+                current = merged.get(key)
+                if current is None or current.get('saved_at', 0) < entry.get('saved_at', 0):
+                    merged[key] = entry
+
+        endpoints = self._data['endpoints']
+        for key, removed_at in list(forgotten.items()):
+            if key in endpoints and endpoints[key].get('saved_at', 0) <= removed_at:
+                del endpoints[key]
+            # TTL이 지난 삭제 기록은 더 이상 필요 없음
+            if time.time() - removed_at >= self.ttl:
+                del forgotten[key]
+
+    def _save(self):
+        """파일 잠금을 잡고 디스크 내용과 병합한 뒤 고유한 임시 파일에 써서 교체"""
+        directory = os.path.dirname(self.path)
+        tmp_path = None
+
+        with _file_lock(self.path):
+            self._merge_disk()
+            try:
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory or '.',
+                                                 prefix='.endpoint_cache-', suffix='.tmp', delete=False) as f:
+                    tmp_path = f.name
+                    json.dump(self._data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"엔드포인트 캐시 저장 실패: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _is_fresh(self, entry):
+        return entry is not None and time.time() - entry.get('saved_at', 0) < self.ttl
+
+    def get_endpoint(self, key):
+        """마지막으로 아파트 데이터를 반환한 요청 정보"""
+        with self._lock:
+            entry = self._data['endpoints'].get(key)
+            return entry['request'] if self._is_fresh(entry) else None
+
+    def remember_endpoint(self, key, request_info):
+        """아파트 데이터를 반환한 요청 정보 저장"""
+        with self._lock:
+            self._data['endpoints'][key] = {
+                'request': request_info,
+                'saved_at': time.time()
+            }
+            self._save()
+
+    def forget_endpoint(self, key):
+        """더 이상 동작하지 않는 요청 정보 삭제"""
+        with self._lock:
+            if self._data['endpoints'].pop(key, None) is not None:
+                self._data['forgotten'][key] = time.time()
+                self._save()
+
+    def get_bundle(self, src, digest=None):
+        """분석한 JS 번들의 엔드포인트 목록 (해시가 주어지면 내용 일치 시에만)"""
+        with self._lock:
+            entry = self._data['bundles'].get(src)
+            if not self._is_fresh(entry):
+                return None
+            if digest is not None and entry.get('hash') != digest:
+                return None
+            return entry['endpoints']
+
+    def get_bundle_entry(self, src):
+        """조건부 요청으로 재검증할 JS 번들 정보 (해시, 엔드포인트, ETag/Last-Modified) - TTL과 무관"""
+        with self._lock:
+            entry = self._data['bundles'].get(src)
+            return dict(entry) if entry is not None else None
+
+    def remember_bundle(self, src, digest, endpoints, etag=None, last_modified=None):
+        """JS 번들 분석 결과 저장 (재검증용 응답 검증자 포함)"""
+        with self._lock:
+            self._data['bundles'][src] = {
+                'hash': digest,
+                'endpoints': sorted(endpoints),
+                'etag': etag,
+                'last_modified': last_modified,
+                'saved_at': time.time()
+            }
+            self._save()
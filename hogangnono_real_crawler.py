@@ -3,13 +3,125 @@
 호갱노노 실제 데이터 크롤러 - 개선된 버전
 """
 
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import json
 import time
 from datetime import datetime
 import re
+import hashlib
+from bisect import bisect_left
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from probe_engine import ConcurrentProbeEngine, ProbeRequest
+from endpoint_cache import EndpointCache
+from crawler_session import create_session
+from html_parsing import parse_response
+from selector_planner import get_selector_planner
+from apartment_dedup import dedupe_apartments
+from records import ApartmentRecord
+
+# 엔드포인트 캐시 키
+SEARCH_CACHE_KEY = 'real_search'
+
+# JS 번들에서 API 엔드포인트를 찾는 단일 패턴 (/api/..., 또는 search/region/apt를 포함한 문자열 경로)
+API_PATH_PATTERN = re.compile(rb'/api/[a-zA-Z0-9/_-]+')
+API_ENDPOINT_PATTERN = re.compile(
+    API_PATH_PATTERN.pattern +
+    rb'|"/[a-zA-Z0-9/_-]*(?:search|region|apt)[a-zA-Z0-9/_-]*"'
+)
+
+# 아파트 이름 패턴
+APARTMENT_NAME_PATTERNS = [
+    re.compile(r'([가-힣\s]+(?:아파트|힐스테이트|래미안|푸르지오|자이|롯데캐슬|이편한세상|센트럴파크|아이파크))'),
+    re.compile(r'([가-힣\s]+(?:마을|단지|타운|빌라))'),
+    re.compile(r'([가-힣\s]+(?:\d+차|\d+단지))')
+]
+
+# 아파트 이름으로 보지 않는 문구
+EXCLUDED_NAMES = {'용인시 수지구', '경기도'}
+
+# 줄 구분자 ('세대', '입주' 문구도 줄바꿈으로 취급)
+LINE_BREAK_PATTERN = re.compile(r'세대|입주|\n')
+
+# 수지구 동 이름
+SUJI_DONGS = ['풍덕천동', '동천동', '상현동', '성복동', '신봉동', '죽전동']
+SUJI_DONG_SET = set(SUJI_DONGS)
+
+# 텍스트에서 직접 찾는 알려진 아파트 이름들
+KNOWN_APARTMENTS = [
+    '힐스테이트수지', '용인수지신정마을1단지', '용인수지신정마을9단지',
+    '수지삼성4차', '용인수지풍림2차', '용인수지휴엔하임',
+    '용인수지동도센트리움', '용인수지성복아이비힐', 'e편한세상수지',
+    '성동마을수지자이'
+]
+
+# 알려진 단지명과 동 이름을 한 번에 찾는 결합 패턴 (긴 이름 우선)
+KNOWN_NAME_PATTERN = re.compile('|'.join(
+    re.escape(name) for name in sorted(KNOWN_APARTMENTS + SUJI_DONGS, key=len, reverse=True)
+))
+
+# 청크 경계에서 잘린 엔드포인트를 다시 검사하기 위해 남겨두는 길이 (엔드포인트 최대 길이)
+ENDPOINT_MAX_LENGTH = 512
+
+BUNDLE_CHUNK_SIZE = 64 * 1024
+BUNDLE_SCAN_WORKERS = 6
+
+
+def iter_text_lines(text):
+    """줄 구분자로 나눈 각 줄을 (앞뒤 공백 제거한 줄, 시작 위치, 끝 위치)로 반환"""
+    line_start = 0
+    separators = list(LINE_BREAK_PATTERN.finditer(text))
+    
+    for separator in separators + [None]:
+        line_end = separator.start() if separator else len(text)
+        segment = text[line_start:line_end]
+        line = segment.strip()
+        
+        if line:
+            offset = line_start + (len(segment) - len(segment.lstrip()))
+            yield line, offset, offset + len(line)
+        else:
+            yield line, line_start, line_start
+        
+        if separator:
+            line_start = separator.end()
+
+
+def extract_api_endpoints(chunks):
+    """바이트 청크 스트림에서 API 엔드포인트를 한 번의 패턴 검사로 추출"""
+    endpoints = set()
+    carry = b''
+    
+    def collect(match):
+        token = match.group()
+        candidates = [token.strip(b'"')]
+        # 문자열 경로 안에 포함된 /api/ 경로도 별도 엔드포인트로 수집
+        if token.startswith(b'"') and b'/api/' in token:
+            candidates.extend(API_PATH_PATTERN.findall(token))
+        
+        for candidate in candidates:
+            if len(candidate) > 3:
+                endpoints.add(candidate.decode('ascii'))
+    
+    for chunk in chunks:
+        buffer = carry + chunk
+        # 버퍼 끝부분의 매치는 다음 청크로 이어질 수 있으므로 보류
+        safe_end = len(buffer) - ENDPOINT_MAX_LENGTH
+        keep_from = max(safe_end, 0)
+        
+        for match in API_ENDPOINT_PATTERN.finditer(buffer):
+            if match.end() >= safe_end:
+                keep_from = min(keep_from, match.start())
+                break
+            collect(match)
+        
+        carry = buffer[keep_from:]
+    
+    for match in API_ENDPOINT_PATTERN.finditer(carry):
+        collect(match)
+    
+    return endpoints
 
 class HogangnonoRealCrawler:
     def __init__(self):
@@ -26,52 +138,68 @@ class HogangnonoRealCrawler:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0'
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # 크롤러들이 연결 풀, 요청 스케줄러, HTTP 응답 캐시를 공유하는 세션
+        self.session = create_session(self.headers)
+        
+        # 후보 요청 동시 탐색 엔진
+        self.probe_engine = ConcurrentProbeEngine(self.session, per_host_limit=10, timeout=10)
+        
+        # 성공한 검색 요청과 분석한 JS 번들 캐시
+        self.endpoint_cache = EndpointCache()
+        
+        # 페이지 유형별 선택자 시도 순서
+        self.selector_planner = get_selector_planner()
     
     def analyze_site_structure(self):
         """호갱노노 사이트 구조 심층 분석"""
         print("=== 호갱노노 사이트 구조 심층 분석 ===")
         
         try:
+            # 0. 이전 실행에서 성공한 검색 요청 재사용
+            cached_result = self.try_cached_search()
+            if cached_result:
+                return cached_result
+            
             # 메인 페이지 접속
             response = self.session.get(self.base_url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_response(response, 'main_page')
             
             # 1. JavaScript 파일에서 API 엔드포인트 찾기
             print("1. JavaScript 파일 분석...")
             js_files = soup.find_all('script', src=True)
             
             api_endpoints = set()
+            pending_bundles = []
             for script in js_files:
                 src = script['src']
                 if not src.startswith('http'):
                     src = f"{self.base_url}{src}"
                 
-                try:
-                    js_response = self.session.get(src, timeout=10)
-                    if js_response.status_code == 200:
-                        js_content = js_response.text
-                        
-                        # API 엔드포인트 패턴 찾기
-                        api_patterns = [
-                            r'/api/[a-zA-Z0-9/_-]+',
-                            r'"/[a-zA-Z0-9/_-]*search[a-zA-Z0-9/_-]*"',
-                            r'"/[a-zA-Z0-9/_-]*region[a-zA-Z0-9/_-]*"',
-                            r'"/[a-zA-Z0-9/_-]*apt[a-zA-Z0-9/_-]*"'
-                        ]
+                if src not in pending_bundles:
+                    pending_bundles.append(src)
+            
+            # 번들은 병렬로 받아 스트리밍 분석 (이미 분석한 번들은 조건부 요청으로 변경 여부만 확인)
+            if pending_bundles:
+                with ThreadPoolExecutor(max_workers=min(BUNDLE_SCAN_WORKERS, len(pending_bundles))) as executor:
+                    futures = {
+                        executor.submit(self.scan_js_bundle, src, self.endpoint_cache.get_bundle_entry(src)): src
+                        for src in pending_bundles
+                    }
+                    
+                    for future in as_completed(futures):
+                        scanned = future.result()
+                        if scanned is None:
+                            # 확인하지 못한 번들은 TTL 안의 이전 분석 결과 사용
+                            cached_endpoints = self.endpoint_cache.get_bundle(futures[future])
+                            if cached_endpoints is not None:
+                                api_endpoints.update(cached_endpoints)
+                            continue
                         
-                        for pattern in api_patterns:
-                            matches = re.findall(pattern, js_content)
-                            for match in matches:
-                                endpoint = match.strip('"')
-                                if len(endpoint) > 3:
-                                    api_endpoints.add(endpoint)
-                
-                except Exception as e:
-                    continue
+                        src, digest, bundle_endpoints, validators = scanned
+                        self.endpoint_cache.remember_bundle(src, digest, bundle_endpoints, **validators)
+                        api_endpoints.update(bundle_endpoints)
             
             print(f"발견된 API 엔드포인트: {list(api_endpoints)}")
             
@@ -87,12 +215,54 @@ class HogangnonoRealCrawler:
             print(f"사이트 구조 분석 오류: {e}")
             return False
     
+    def scan_js_bundle(self, src, cached=None):
+        """JS 번들을 청크 단위로 받으며 API 엔드포인트 추출 - (src, 해시, 엔드포인트, 검증자) 반환
+        
+        cached: 이전 분석 결과 (있으면 조건부 요청을 보내 304이면 다시 분석하지 않음)
+        """
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        try:
+            with self.session.get(src, timeout=10, stream=True, headers=headers) as js_response:
+                validators = {
+                    'etag': js_response.headers.get('ETag'),
+                    'last_modified': js_response.headers.get('Last-Modified')
+                }
+                
+                # 변경되지 않은 번들은 이전 분석 결과 그대로 사용 (304에 없는 검증자는 이전 값 유지)
+                if js_response.status_code == 304 and cached:
+                    validators = {name: value or cached.get(name) for name, value in validators.items()}
+                    return src, cached['hash'], cached['endpoints'], validators
+                
+                if js_response.status_code != 200:
+                    return None
+                
+                digest = hashlib.sha256()
+                
+                def chunks():
+                    for chunk in js_response.iter_content(chunk_size=BUNDLE_CHUNK_SIZE):
+                        digest.update(chunk)
+                        yield chunk
+                
+                bundle_endpoints = extract_api_endpoints(chunks())
+                if cached and cached.get('hash') != digest.hexdigest():
+                    print(f"JS 번들 변경 감지, 다시 분석: {src}")
+                return src, digest.hexdigest(), bundle_endpoints, validators
+        
+        except Exception as e:
+            return None
+    
     def simulate_user_interaction(self):
         """사용자 상호작용 시뮬레이션"""
         try:
             # 메인 페이지에서 검색 관련 요소 찾기
             response = self.session.get(self.base_url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_response(response, 'main_page')
             
             # 검색 입력 필드 찾기
             search_inputs = soup.find_all('input', {'type': ['text', 'search']})
@@ -136,36 +306,70 @@ class HogangnonoRealCrawler:
             return None
     
     def test_real_search_functionality(self):
-        """실제 검색 기능 테스트"""
+        """실제 검색 기능 테스트 - 모든 검색 방법의 후보 요청을 동시에 탐색"""
         try:
-            # 다양한 검색 방법 시도
-            search_methods = [
-                self.try_ajax_search,
-                self.try_form_search,
-                self.try_url_search,
-                self.try_mobile_api
+            # 다양한 검색 방법의 후보 요청 수집
+            probe_builders = [
+                self.build_ajax_probes,
+                self.build_form_probes,
+                self.build_url_probes,
+                self.build_mobile_probes
             ]
             
-            for method in search_methods:
+            probes = []
+            for builder in probe_builders:
                 try:
-                    result = method()
-                    if result:
-                        print(f"✓ {method.__name__} 성공")
-                        return result
+                    probes.extend(builder())
                 except Exception as e:
-                    print(f"✗ {method.__name__} 실패: {e}")
+                    print(f"✗ {builder.__name__} 실패: {e}")
                     continue
             
+            print(f"후보 요청 {len(probes)}개 동시 탐색...")
+            probe, result = self.probe_engine.run(probes)
+            
+            if result:
+                print(f"✓ {probe.describe()} 성공")
+                self.endpoint_cache.remember_endpoint(SEARCH_CACHE_KEY, probe.to_dict())
+                return result
+            
             return None
             
         except Exception as e:
             print(f"검색 기능 테스트 오류: {e}")
             return None
     
-    def try_ajax_search(self):
-        """AJAX 검색 시도"""
-        print("AJAX 검색 시도...")
+    def try_cached_search(self):
+        """이전 실행에서 아파트 데이터를 반환한 요청 재시도"""
+        record = self.endpoint_cache.get_endpoint(SEARCH_CACHE_KEY)
+        if not record:
+            return None
+        
+        # 캐시 파일에는 허용된 파서 이름만 신뢰
+        if record.get('parser') not in ('parse_json_probe', 'parse_search_results'):
+            self.endpoint_cache.forget_endpoint(SEARCH_CACHE_KEY)
+            return None
+        
+        probe = ProbeRequest.from_dict(record, getattr(self, record['parser']))
+        print(f"캐시된 검색 요청 재사용: {probe.describe()}")
+        
+        _, result = self.probe_engine.run([probe])
+        if result:
+            return result
         
+        print("캐시된 검색 요청 실패, 탐색 재시작")
+        self.endpoint_cache.forget_endpoint(SEARCH_CACHE_KEY)
+        return None
+    
+    def parse_json_probe(self, response):
+        """JSON 응답 후보 파싱"""
+        try:
+            data = response.json()
+        except ValueError:
+            return None
+        return self.parse_json_response(data)
+    
+    def build_ajax_probes(self):
+        """AJAX 검색 후보 요청 생성"""
         # AJAX 헤더 설정
         ajax_headers = self.headers.copy()
         ajax_headers.update({
@@ -191,48 +395,29 @@ class HogangnonoRealCrawler:
             {'search_text': '수지구 아파트'}
         ]
         
+        probes = []
         for endpoint in ajax_endpoints:
             url = f"{self.base_url}{endpoint}"
             
             for params in search_params:
-                try:
-                    # GET 방식
-                    response = self.session.get(url, params=params, headers=ajax_headers, timeout=10)
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                            apartments = self.parse_json_response(data)
-                            if apartments:
-                                return apartments
-                        except:
-                            pass
-                    
-                    # POST 방식
-                    response = self.session.post(url, data=params, headers=ajax_headers, timeout=10)
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                            apartments = self.parse_json_response(data)
-                            if apartments:
-                                return apartments
-                        except:
-                            pass
-                            
-                except Exception as e:
-                    continue
+                # GET 방식
+                probes.append(ProbeRequest('GET', url, self.parse_json_probe, params=params,
+                                           headers=ajax_headers, source='try_ajax_search'))
+                # POST 방식
+                probes.append(ProbeRequest('POST', url, self.parse_json_probe, data=params,
+                                           headers=ajax_headers, source='try_ajax_search'))
         
-        return None
+        return probes
     
-    def try_form_search(self):
-        """폼 기반 검색 시도"""
-        print("폼 기반 검색 시도...")
-        
+    def build_form_probes(self):
+        """폼 기반 검색 후보 요청 생성"""
         # 메인 페이지에서 폼 찾기
         response = self.session.get(self.base_url, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = parse_response(response, 'main_page')
         
         forms = soup.find_all('form')
         
+        probes = []
         for form in forms:
             action = form.get('action', '')
             method = form.get('method', 'GET').upper()
@@ -253,28 +438,19 @@ class HogangnonoRealCrawler:
                         form_data[name] = value
             
             if form_data and action:
-                try:
-                    search_url = action if action.startswith('http') else f"{self.base_url}{action}"
-                    
-                    if method == 'POST':
-                        response = self.session.post(search_url, data=form_data, timeout=10)
-                    else:
-                        response = self.session.get(search_url, params=form_data, timeout=10)
-                    
-                    if response.status_code == 200:
-                        apartments = self.parse_search_results(response)
-                        if apartments:
-                            return apartments
-                            
-                except Exception as e:
-                    continue
+                search_url = action if action.startswith('http') else f"{self.base_url}{action}"
+                
+                if method == 'POST':
+                    probes.append(ProbeRequest('POST', search_url, self.parse_search_results,
+                                               data=form_data, source='try_form_search'))
+                else:
+                    probes.append(ProbeRequest('GET', search_url, self.parse_search_results,
+                                               params=form_data, source='try_form_search'))
         
-        return None
+        return probes
     
-    def try_url_search(self):
-        """URL 기반 검색 시도"""
-        print("URL 기반 검색 시도...")
-        
+    def build_url_probes(self):
+        """URL 기반 검색 후보 요청 생성"""
         # 다양한 URL 패턴 시도
         url_patterns = [
             '/search?q={query}',
@@ -288,26 +464,16 @@ class HogangnonoRealCrawler:
         
         queries = ['용인시+수지구', '수지구', '용인+수지', 'suji', 'yongin+suji']
         
+        probes = []
         for pattern in url_patterns:
             for query in queries:
-                try:
-                    url = f"{self.base_url}{pattern.format(query=query)}"
-                    response = self.session.get(url, timeout=10)
-                    
-                    if response.status_code == 200:
-                        apartments = self.parse_search_results(response)
-                        if apartments:
-                            return apartments
-                            
-                except Exception as e:
-                    continue
+                url = f"{self.base_url}{pattern.format(query=query)}"
+                probes.append(ProbeRequest('GET', url, self.parse_search_results, source='try_url_search'))
         
-        return None
+        return probes
     
-    def try_mobile_api(self):
-        """모바일 API 시도"""
-        print("모바일 API 시도...")
-        
+    def build_mobile_probes(self):
+        """모바일 API 후보 요청 생성"""
         # 모바일 헤더 설정
         mobile_headers = {
             'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1',
@@ -323,26 +489,34 @@ class HogangnonoRealCrawler:
             '/app/api/search'
         ]
         
+        probes = []
         for endpoint in mobile_endpoints:
-            try:
-                url = f"{self.base_url}{endpoint}"
-                params = {'q': '용인시 수지구', 'type': 'apartment'}
-                
-                response = self.session.get(url, params=params, headers=mobile_headers, timeout=10)
-                
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        apartments = self.parse_json_response(data)
-                        if apartments:
-                            return apartments
-                    except:
-                        pass
-                        
-            except Exception as e:
-                continue
+            url = f"{self.base_url}{endpoint}"
+            params = {'q': '용인시 수지구', 'type': 'apartment'}
+            probes.append(ProbeRequest('GET', url, self.parse_json_probe, params=params,
+                                       headers=mobile_headers, source='try_mobile_api'))
         
-        return None
+        return probes
+    
+    def try_ajax_search(self):
+        """AJAX 검색 시도"""
+        print("AJAX 검색 시도...")
+        return self.probe_engine.run(self.build_ajax_probes())[1]
+    
+    def try_form_search(self):
+        """폼 기반 검색 시도"""
+        print("폼 기반 검색 시도...")
+        return self.probe_engine.run(self.build_form_probes())[1]
+    
+    def try_url_search(self):
+        """URL 기반 검색 시도"""
+        print("URL 기반 검색 시도...")
+        return self.probe_engine.run(self.build_url_probes())[1]
+    
+    def try_mobile_api(self):
+        """모바일 API 시도"""
+        print("모바일 API 시도...")
+        return self.probe_engine.run(self.build_mobile_probes())[1]
     
     def parse_json_response(self, data):
         """JSON 응답 파싱"""
@@ -377,8 +551,6 @@ class HogangnonoRealCrawler:
     
     def parse_search_results(self, response):
         """검색 결과 파싱"""
-        apartments = []
-        
         try:
             # JSON 응답인지 확인
             content_type = response.headers.get('content-type', '').lower()
@@ -390,7 +562,7 @@ class HogangnonoRealCrawler:
                     pass
             
             # HTML 파싱
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_response(response)
             
             # 다양한 선택자 시도
             selectors = [
@@ -409,19 +581,14 @@ class HogangnonoRealCrawler:
                 '.list-item'
             ]
             
-            for selector in selectors:
-                elements = soup.select(selector)
-                
-                if elements:
-                    print(f"'{selector}' 선택자로 {len(elements)}개 요소 발견")
-                    
-                    for element in elements:
-                        apt = self.extract_apartment_from_html(element)
-                        if apt and self.is_suji_apartment(apt):
-                            apartments.append(apt)
-                    
-                    if apartments:
-                        break
+            def extract(element):
+                # 요소 하나에서 여러 아파트가 추출될 수 있음
+                candidates = self.extract_apartment_from_html(element) or []
+                return [apt for apt in candidates if self.is_suji_apartment(apt)]
+            
+            # 페이지 유형(경로 첫 부분)별로 결과를 낸 선택자 우선 시도
+            page_type = 'search_results:' + urlsplit(response.url or '').path.strip('/').split('/')[0]
+            apartments = self.selector_planner.run(page_type, soup, selectors, extract)
             
             return apartments if apartments else None
             
@@ -454,11 +621,11 @@ class HogangnonoRealCrawler:
                     break
             
             if name and address:
-                return {
-                    'name': name,
-                    'address': address,
-                    'url': item.get('url', item.get('link', None))
-                }
+                return ApartmentRecord(
+                    name=name,
+                    address=address,
+                    url=item.get('url', item.get('link', None))
+                )
             
             return None
             
@@ -473,68 +640,62 @@ class HogangnonoRealCrawler:
             
             # 호갱노노 검색 결과에서 아파트 정보 추출
             if '용인시 수지구' in text_content:
-                # 아파트 패턴 찾기
-                apartment_patterns = [
-                    r'([가-힣\s]+(?:아파트|힐스테이트|래미안|푸르지오|자이|롯데캐슬|이편한세상|센트럴파크|아이파크))',
-                    r'([가-힣\s]+(?:마을|단지|타운|빌라))',
-                    r'([가-힣\s]+(?:\d+차|\d+단지))'
-                ]
+                # 알려진 단지명과 동 이름 위치를 한 번의 검사로 수집
+                known_positions = {}
+                dong_starts = []
+                dong_matches = []
                 
-                # 동 이름 패턴
-                dong_pattern = r'(풍덕천동|동천동|상현동|성복동|신봉동|죽전동)'
+                for match in KNOWN_NAME_PATTERN.finditer(text_content):
+                    name = match.group()
+                    if name in SUJI_DONG_SET:
+                        dong_starts.append(match.start())
+                        dong_matches.append(match)
+                    else:
+                        known_positions.setdefault(name, match.start())
                 
-                # 텍스트를 줄 단위로 분리
-                lines = text_content.replace('세대', '\n').replace('입주', '\n').split('\n')
+                def find_dong(start, end):
+                    """구간 안에서 가장 앞에 있는 동 이름"""
+                    index = bisect_left(dong_starts, start)
+                    if index < len(dong_starts) and dong_matches[index].end() <= end:
+                        return dong_matches[index].group()
+                    return '수지구'
                 
-                for line in lines:
-                    line = line.strip()
+                # 텍스트를 줄 단위로 나누어 아파트 이름 추출
+                for line, line_start, line_end in iter_text_lines(text_content):
                     if len(line) < 5 or len(line) > 100:
                         continue
                     
-                    # 아파트 이름 추출
-                    for pattern in apartment_patterns:
-                        matches = re.findall(pattern, line)
-                        for match in matches:
+                    dong = None
+                    for pattern in APARTMENT_NAME_PATTERNS:
+                        for match in pattern.findall(line):
                             apt_name = match.strip()
-                            if len(apt_name) > 3 and apt_name not in ['용인시 수지구', '경기도']:
-                                
-                                # 해당 동 찾기
-                                dong_match = re.search(dong_pattern, line)
-                                dong = dong_match.group(1) if dong_match else '수지구'
+                            if len(apt_name) > 3 and apt_name not in EXCLUDED_NAMES:
                                 
-                                address = f"경기도 용인시 수지구 {dong}"
+                                # 해당 동 찾기 (줄마다 한 번)
+                                if dong is None:
+                                    dong = find_dong(line_start, line_end)
                                 
-                                apartments.append({
-                                    'name': apt_name,
-                                    'address': address,
-                                    'url': None
-                                })
+                                apartments.append(ApartmentRecord(
+                                    name=apt_name,
+                                    address=f"경기도 용인시 수지구 {dong}",
+                                    url=None,
+                                    dong=dong
+                                ))
                 
-                # 특정 아파트 이름들 직접 추출
-                known_apartments = [
-                    '힐스테이트수지', '용인수지신정마을1단지', '용인수지신정마을9단지',
-                    '수지삼성4차', '용인수지풍림2차', '용인수지휴엔하임',
-                    '용인수지동도센트리움', '용인수지성복아이비힐', 'e편한세상수지',
-                    '성동마을수지자이'
-                ]
-                
-                for apt_name in known_apartments:
-                    if apt_name in text_content:
-                        # 동 정보 찾기
-                        context_start = max(0, text_content.find(apt_name) - 50)
-                        context_end = min(len(text_content), text_content.find(apt_name) + 50)
-                        context = text_content[context_start:context_end]
-                        
-                        dong_match = re.search(dong_pattern, context)
-                        dong = dong_match.group(1) if dong_match else '수지구'
-                        
-                        address = f"경기도 용인시 수지구 {dong}"
-                        
-                        apartments.append({
-                            'name': apt_name,
-                            'address': address,
-                            'url': None
-                        })
+                # 특정 아파트 이름들 직접 추출 (앞뒤 50자 안의 동 정보 사용)
+                for apt_name in KNOWN_APARTMENTS:
+                    position = known_positions.get(apt_name)
+                    if position is None:
+                        continue
+                    
+                    dong = find_dong(max(0, position - 50), min(len(text_content), position + 50))
+                    
+                    apartments.append(ApartmentRecord(
+                        name=apt_name,
+                        address=f"경기도 용인시 수지구 {dong}",
+                        url=None,
+                        dong=dong
+                    ))
             
             return apartments if apartments else None
             
@@ -544,8 +705,8 @@ class HogangnonoRealCrawler:
     
     def is_suji_apartment(self, apartment):
         """수지구 아파트인지 확인"""
-        address = apartment.get('address', '').lower()
-        name = apartment.get('name', '').lower()
+        address = apartment.address.lower()
+        name = apartment.name.lower()
         
         suji_keywords = ['수지', 'suji', '용인', 'yongin']
         
@@ -556,21 +717,17 @@ class HogangnonoRealCrawler:
         print("=== 호갱노노에서 수지구 아파트 데이터 수집 ===")
         
         # 1. 사이트 구조 분석 및 검색
-        apartments = self.analyze_site_structure()
+        try:
+            apartments = self.analyze_site_structure()
+        finally:
+            # 선택자 통계는 페이지마다가 아니라 수집이 끝날 때 한 번 저장
+            self.selector_planner.save()
         
         if apartments:
             print(f"✓ 실제 데이터 수집 성공: {len(apartments)}개 아파트")
             
-            # 중복 제거
-            unique_apartments = []
-            seen_names = set()
-            
-            for apt in apartments:
-                if apt['name'] not in seen_names:
-                    unique_apartments.append(apt)
-                    seen_names.add(apt['name'])
-            
-            return unique_apartments
+            # 중복 제거 (표기만 다른 유사 단지도 하나로 병합)
+            return dedupe_apartments(apartments)
         else:
             print("⚠ 실제 데이터 수집 실패, 현실적인 샘플 데이터 사용")
             return self.get_realistic_sample_data()
@@ -578,21 +735,21 @@ class HogangnonoRealCrawler:
     def get_realistic_sample_data(self):
         """현실적인 샘플 데이터"""
         return [
-            {'name': '수지구청역 푸르지오', 'address': '경기도 용인시 수지구 풍덕천동 1191', 'url': None},
-            {'name': '동천역 래미안', 'address': '경기도 용인시 수지구 동천동 887', 'url': None},
-            {'name': '수지구 롯데캐슬', 'address': '경기도 용인시 수지구 성복동 638', 'url': None},
-            {'name': '죽전역 이편한세상', 'address': '경기도 용인시 수지구 죽전동 1258', 'url': None},
-            {'name': '신분당선 래미안', 'address': '경기도 용인시 수지구 상현동 532', 'url': None},
-            {'name': '수지구 힐스테이트', 'address': '경기도 용인시 수지구 신봉동 355', 'url': None},
-            {'name': '동천동 푸르지오', 'address': '경기도 용인시 수지구 동천동 965', 'url': None},
-            {'name': '죽전동 자이', 'address': '경기도 용인시 수지구 죽전동 1342', 'url': None},
-            {'name': '풍덕천동 래미안', 'address': '경기도 용인시 수지구 풍덕천동 1456', 'url': None},
-            {'name': '상현역 푸르지오', 'address': '경기도 용인시 수지구 상현동 789', 'url': None},
-            {'name': '수지구 센트럴파크', 'address': '경기도 용인시 수지구 성복동 741', 'url': None},
-            {'name': '죽전역 롯데캐슬', 'address': '경기도 용인시 수지구 죽전동 1567', 'url': None},
-            {'name': '동천역 힐스테이트', 'address': '경기도 용인시 수지구 동천동 1123', 'url': None},
-            {'name': '수지구 아이파크', 'address': '경기도 용인시 수지구 신봉동 456', 'url': None},
-            {'name': '신분당선 자이', 'address': '경기도 용인시 수지구 상현동 678', 'url': None}
+            ApartmentRecord('수지구청역 푸르지오', '경기도 용인시 수지구 풍덕천동 1191'),
+            ApartmentRecord('동천역 래미안', '경기도 용인시 수지구 동천동 887'),
+            ApartmentRecord('수지구 롯데캐슬', '경기도 용인시 수지구 성복동 638'),
+            ApartmentRecord('죽전역 이편한세상', '경기도 용인시 수지구 죽전동 1258'),
+            ApartmentRecord('신분당선 래미안', '경기도 용인시 수지구 상현동 532'),
+            ApartmentRecord('수지구 힐스테이트', '경기도 용인시 수지구 신봉동 355'),
+            ApartmentRecord('동천동 푸르지오', '경기도 용인시 수지구 동천동 965'),
+            ApartmentRecord('죽전동 자이', '경기도 용인시 수지구 죽전동 1342'),
+            ApartmentRecord('풍덕천동 래미안', '경기도 용인시 수지구 풍덕천동 1456'),
+            ApartmentRecord('상현역 푸르지오', '경기도 용인시 수지구 상현동 789'),
+            ApartmentRecord('수지구 센트럴파크', '경기도 용인시 수지구 성복동 741'),
+            ApartmentRecord('죽전역 롯데캐슬', '경기도 용인시 수지구 죽전동 1567'),
+            ApartmentRecord('동천역 힐스테이트', '경기도 용인시 수지구 동천동 1123'),
+            ApartmentRecord('수지구 아이파크', '경기도 용인시 수지구 신봉동 456'),
+            ApartmentRecord('신분당선 자이', '경기도 용인시 수지구 상현동 678')
         ]
 
 def main():
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+HTML 파싱 계층 - lxml 파서 우선 사용, 필요한 태그만 부분 파싱, 같은 응답의 파싱 결과 재사용
+"""
+
+import threading
+from collections import OrderedDict
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+# 사용 가능한 가장 빠른 파서 (lxml이 없으면 내장 html.parser)
+DEFAULT_PARSER = 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+
+# 페이지 용도별 부분 파싱 대상
+PARSE_TARGETS = {
+    # 메인 페이지: 스크립트, 검색 폼/입력 필드, 링크
+    'main_page': SoupStrainer(['script', 'form', 'input', 'a']),
+    # 거래 내역 행 (여러 class 값을 가진 행도 남기도록 class 조건은 조회 시 적용)
+    'transactions': SoupStrainer('tr'),
+}
+
+
+def parse_html(markup, target=None, parser=None):
+    """HTML 문자열/바이트 파싱 (target이 주어지면 해당 태그만 파싱)"""
+    parse_only = PARSE_TARGETS[target] if target else None
+    return BeautifulSoup(markup, parser or DEFAULT_PARSER, parse_only=parse_only)
+
+
+class ParsedPageCache:
+    """같은 응답 본문의 파싱 결과를 재사용하는 LRU 캐시"""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_soup(self, response, target=None):
+        """응답을 파싱한 BeautifulSoup 반환 (전체 파싱 결과가 있으면 부분 파싱 요청에도 재사용)"""
+        content = response.content
+        page_key = (response.url, len(content), hash(content))
+
+        with self._lock:
+            for key in ((page_key, target), (page_key, None)):
+                soup = self._entries.get(key)
+                if soup is not None:
+                    self._entries.move_to_end(key)
+                    return soup
+
+        soup = parse_html(content, target)
+
+        with self._lock:
+            self._entries[(page_key, target)] = soup
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return soup
+
+
+_page_cache = ParsedPageCache()
+
+
+def parse_response(response, target=None):
+    """requests 응답 파싱 (크롤러 전체에서 파싱 결과 공유)"""
+    return _page_cache.get_soup(response, target)
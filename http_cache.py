@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+HTTP 응답 캐시 - ETag/Last-Modified 재검증을 지원하는 메모리+디스크 2단계 캐시
+"""
+
+import email.utils
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DEFAULT_CACHE_DIR = os.path.join('.crawler_cache', 'http')
+
+# 캐시하는 요청 메소드와 응답 상태 코드 (일시적일 수 있는 404는 캐시하지 않음)
+CACHEABLE_METHODS = ('GET', 'HEAD')
+CACHEABLE_STATUS = (200, 203, 300, 301, 410)
+
+
+def parse_cache_control(value):
+    """Cache-Control 헤더를 {지시자: 값} 딕셔너리로 변환"""
+    directives = {}
+    for part in (value or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition('=')
+        directives[name.strip().lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+def parse_http_date(value):
+    """HTTP 날짜 헤더를 유닉스 시간으로 변환"""
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class CacheEntry:
+    """캐시된 응답 하나"""
+
+    __slots__ = ('url', 'status', 'reason', 'headers', 'body', 'stored_at', 'fresh_until')
+
+    def __init__(self, url, status, reason, headers, body, stored_at, fresh_until):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+        self.stored_at = stored_at
+        self.fresh_until = fresh_until
+
+    @property
+    def etag(self):
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self):
+        return self.headers.get('Last-Modified')
+
+    def is_fresh(self, now=None, max_age=None):
+        """신선도 확인 (max_age: 요청의 Cache-Control max-age - 이보다 오래된 항목은 재검증)"""
+        now = now or time.time()
+        if max_age is not None and now - self.stored_at >= max_age:
+            return False
+        return now < self.fresh_until
+
+    def to_response(self, request):
+        """캐시 항목으로 requests.Response 생성"""
+        response = Response()
+        response.status_code = self.status
+        response.reason = self.reason
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.body
+        response._content_consumed = True
+        response.url = self.url
+        response.request = request
+        response.from_cache = True
+        return response
+
+
+class HTTPCache:
+    """LRU 메모리 계층과 디스크 계층으로 구성된 응답 캐시"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_memory_entries=256, max_disk_entries=2048,
+                 max_body_size=10 * 1024 * 1024, default_ttl=300):
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.max_body_size = max_body_size
+        # 만료 정보가 없는 응답의 기본 신선도 유지 시간 (초)
+        self.default_ttl = default_ttl
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(request):
+        """요청 메소드, URL, Accept 헤더로 캐시 키 생성"""
+        raw = f"{request.method} {request.url} {request.headers.get('Accept', '')}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _disk_paths(self, key):
+        return (os.path.join(self.cache_dir, f"{key}.json"),
+                os.path.join(self.cache_dir, f"{key}.body"))
+
+    def get(self, key):
+        """캐시 항목 조회 (메모리 → 디스크 순)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+            entry = self._read_disk(key)
+            if entry is not None:
+                self._remember(key, entry)
+            return entry
+
+    def set(self, key, entry):
+        """캐시 항목 저장 (메모리와 디스크 모두)"""
+        if entry.body is not None and len(entry.body) > self.max_body_size:
+            return
+        with self._lock:
+            self._remember(key, entry)
+            self._write_disk(key, entry)
+
+    def refresh(self, key, entry, headers):
+        """304 응답으로 재검증된 항목의 헤더와 만료 시간 갱신"""
+        for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date'):
+            if name in headers:
+                entry.headers[name] = headers[name]
+        entry.stored_at = time.time()
+        entry.fresh_until = self.freshness_deadline(entry.headers, entry.stored_at)
+        self.set(key, entry)
+
+    def delete(self, key):
+        with self._lock:
+            self._memory.pop(key, None)
+            for path in self._disk_paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _remember(self, key, entry):
+        """메모리 계층에 저장하고 LRU 초과분 제거"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key):
+        meta_path, body_path = self._disk_paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+            # 접근 시간 갱신 (디스크 LRU 기준)
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            return None
+
+        return CacheEntry(meta['url'], meta['status'], meta.get('reason'), meta['headers'],
+                          body, meta['stored_at'], meta['fresh_until'])
+
+    def _write_disk(self, key, entry):
+        meta_path, body_path = self._disk_paths(key)
+        meta = {
+            'url': entry.url,
+            'status': entry.status,
+            'reason': entry.reason,
+            'headers': dict(entry.headers),
+            'stored_at': entry.stored_at,
+            'fresh_until': entry.fresh_until
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(f"{body_path}.tmp", 'wb') as f:
+                f.write(entry.body or b'')
+            os.replace(f"{body_path}.tmp", body_path)
+            with open(f"{meta_path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(f"{meta_path}.tmp", meta_path)
+        except OSError as e:
+            print(f"HTTP 캐시 저장 실패: {e}")
+            return
+
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """디스크 항목 수가 한도를 넘으면 가장 오래 사용되지 않은 항목부터 삭제"""
+        try:
+            meta_files = [name for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+        except OSError:
+            return
+        if len(meta_files) <= self.max_disk_entries:
+            return
+
+        def last_used(name):
+            try:
+                return os.path.getmtime(os.path.join(self.cache_dir, name))
+            except OSError:
+                return 0
+
+        meta_files.sort(key=last_used)
+        for name in meta_files[:len(meta_files) - self.max_disk_entries]:
+            key = name[:-len('.json')]
+            self._memory.pop(key, None)
+            for path in self._disk_paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def freshness_deadline(self, headers, now=None):
+        """응답 헤더로 신선도 만료 시각 계산"""
+        now = now or time.time()
+        cache_control = parse_cache_control(headers.get('Cache-Control'))
+
+        if 'no-cache' in cache_control:
+            return now
+
+        max_age = cache_control.get('s-maxage') or cache_control.get('max-age')
+        if max_age is not None:
+            try:
+                return now + int(max_age)
+            except ValueError:
+                return now
+
+        expires = parse_http_date(headers.get('Expires'))
+        if expires is not None:
+            return expires
+
+        # 휴리스틱 신선도: Last-Modified 이후 경과 시간의 10% (기본값 한도)
+        last_modified = parse_http_date(headers.get('Last-Modified'))
+        if last_modified is not None:
+            return now + min(self.default_ttl, max(0, (now - last_modified) * 0.1))
+
+        # 만료 정보도 검증자도 없는 응답(동적 검색 결과 등)은 신선하지 않은 것으로 취급
+        return now
+
+
+class CachingAdapter(BaseAdapter):
+    """다른 어댑터를 감싸 GET 응답을 캐시하고 조건부 요청으로 재검증하는 어댑터"""
+
+    def __init__(self, cache, transport=None):
+        super().__init__()
+        self.cache = cache
+        self.transport = transport or HTTPAdapter()
+
+    def send(self, request, **kwargs):
+        if request.method not in CACHEABLE_METHODS or kwargs.get('stream'):
+            return self.transport.send(request, **kwargs)
+
+        request_cc = parse_cache_control(request.headers.get('Cache-Control'))
+        key = self.cache.make_key(request)
+        entry = self.cache.get(key)
+
+        # 요청의 max-age(예: max-age=0)보다 오래된 항목은 신선해도 재검증
+        try:
+            max_age = int(request_cc['max-age']) if request_cc.get('max-age') is not None else None
+        except ValueError:
+            max_age = 0
+
+        # 신선한 캐시: 네트워크 요청 없이 응답
+        if entry is not None and entry.is_fresh(max_age=max_age) and 'no-cache' not in request_cc:
+            return entry.to_response(request)
+
+        # 만료된 캐시: 검증자가 있으면 조건부 요청
+        conditional = request
+        if entry is not None and (entry.etag or entry.last_modified):
+            conditional = request.copy()
+            if entry.etag:
+                conditional.headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                conditional.headers['If-Modified-Since'] = entry.last_modified
+
+        response = self.transport.send(conditional, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key, entry, response.headers)
+            response.close()
+            cached = entry.to_response(request)
+            # 304 응답의 Set-Cookie가 세션 쿠키 저장소에 반영되도록 원래 응답의 raw 사용
+            cached.raw = response.raw
+            return cached
+
+        self._store(key, request, response)
+        return response
+
+    def _store(self, key, request, response):
+        """캐시 가능한 응답 저장"""
+        if response.status_code not in CACHEABLE_STATUS:
+            return
+
+        response_cc = parse_cache_control(response.headers.get('Cache-Control'))
+        request_cc = parse_cache_control(request.headers.get('Cache-Control'))
+        if 'no-store' in response_cc or 'no-store' in request_cc:
+            return
+
+        # 캐시에서 응답하면 Set-Cookie가 세션에 반영되지 않으므로 쿠키를 설정하는 응답은 저장하지 않음
+        if 'Set-Cookie' in response.headers:
+            return
+
+        now = time.time()
+        entry = CacheEntry(
+            response.url,
+            response.status_code,
+            response.reason,
+            dict(response.headers),
+            response.content,
+            now,
+            self.cache.freshness_deadline(response.headers, now)
+        )
+
+        # 신선하지도 않고 재검증할 수도 없는 응답은 저장해도 쓸 수 없음
+        if not entry.is_fresh(now) and not (entry.etag or entry.last_modified):
+            return
+        self.cache.set(key, entry)
+
+    def close(self):
+        self.transport.close()
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache():
+    """크롤러 클래스들이 공유하는 HTTP 캐시"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HTTPCache()
+        return _shared_cache
+
+
+def install_http_cache(session, cache=None, transport=None):
+    """세션에 캐시 어댑터 장착"""
+    adapter = CachingAdapter(cache or get_shared_cache(), transport)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return adapter
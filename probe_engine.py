@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+동시 요청 탐색 엔진 - 후보 요청들을 병렬로 시도하고 첫 성공 시 나머지를 취소
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit
+
+from rate_limiter import cancel_scope
+
+
+class ProbeRequest:
+    """탐색할 후보 요청 하나"""
+
+    __slots__ = ('method', 'url', 'params', 'data', 'headers', 'parser', 'source')
+
+    def __init__(self, method, url, parser, params=None, data=None, headers=None, source=''):
+        self.method = method.upper()
+        self.url = url
+        self.parser = parser
+        self.params = params
+        self.data = data
+        self.headers = headers
+        self.source = source
+
+    def describe(self):
+        """로그용 요청 설명"""
+        path = urlsplit(self.url).path or '/'
+        return f"{self.source} {self.method} {path}"
+
+    def to_dict(self):
+        """캐시 저장용 직렬화 (파서는 메소드 이름으로 저장)"""
+        return {
+            'method': self.method,
+            'url': self.url,
+            'params': self.params,
+            'data': self.data,
+            'headers': self.headers,
+            'parser': self.parser.__name__,
+            'source': self.source
+        }
+
+    @classmethod
+    def from_dict(cls, record, parser):
+        """캐시에서 읽은 요청 정보로 후보 요청 복원"""
+        return cls(
+            record['method'],
+            record['url'],
+            parser,
+            params=record.get('params'),
+            data=record.get('data'),
+            headers=record.get('headers'),
+            source=record.get('source', '')
+        )
+
+
+def interleave_probes(probes):
+    """검색 방법별 후보 요청을 번갈아 배치 (한 방법이 슬롯을 독점하지 않도록)"""
+    groups = {}
+    for probe in probes:
+        groups.setdefault(probe.source, []).append(probe)
+
+    ordered = []
+    queues = list(groups.values())
+    index = 0
+    while queues:
+        queues = [queue for queue in queues if index < len(queue)]
+        ordered.extend(queue[index] for queue in queues)
+        index += 1
+
+    return ordered
+
+
+class ConcurrentProbeEngine:
+    """호스트별 동시성 제한과 첫 성공 취소 정책을 갖는 탐색 엔진"""
+
+    def __init__(self, session, max_workers=16, per_host_limit=10, timeout=10, deadline=None):
+        self.session = session
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        # 전체 탐색 시간 한도 (None이면 실행할 요청 묶음 수에 비례하여 계산)
+        self.deadline = deadline
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+
+    def _get_host_slot(self, url):
+        """호스트별 세마포어 반환"""
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_slots[host] = slot
+            return slot
+
+    def deadline_for(self, probes):
+        """전체 탐색 시간 한도 - 동시성 제한으로 나뉘는 실행 묶음마다 요청 타임아웃의 1.5배"""
+        if self.deadline is not None:
+            return self.deadline
+
+        per_host = {}
+        for probe in probes:
+            host = urlsplit(probe.url).netloc
+            per_host[host] = per_host.get(host, 0) + 1
+
+        waves = max(
+            math.ceil(len(probes) / self.max_workers),
+            max(math.ceil(count / self.per_host_limit) for count in per_host.values())
+        )
+        return self.timeout * 1.5 * waves
+
+    def _execute(self, probe, stop_event):
+        """단일 후보 요청 실행 - 성공 시 파싱 결과, 실패 시 None"""
+        slot = self._get_host_slot(probe.url)
+
+        # 이미 다른 요청이 성공했으면 슬롯을 기다리지 않고 종료
+        while not slot.acquire(timeout=0.1):
+            if stop_event.is_set():
+                return None
+
+        try:
+            if stop_event.is_set():
+                return None
+
+            # 토큰 버킷에서 대기하는 동안 다른 요청이 성공하면 보내지 않음
+            with cancel_scope(stop_event):
+                response = self.session.request(
+                    probe.method,
+                    probe.url,
+                    params=probe.params,
+                    data=probe.data,
+                    headers=probe.headers,
+                    timeout=self.timeout
+                )
+
+            if response.status_code != 200:
+                return None
+
+            return probe.parser(response) or None
+
+        except Exception:
+            return None
+
+        finally:
+            slot.release()
+
+    def run(self, probes):
+        """후보 요청들을 동시에 실행하여 (성공한 요청, 결과) 반환"""
+        probes = interleave_probes(probes)
+        if not probes:
+            return None, None
+
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(probes)))
+        deadline = self.deadline_for(probes)
+        started = time.monotonic()
+
+        try:
+            pending = {executor.submit(self._execute, probe, stop_event): probe for probe in probes}
+
+            while pending:
+                remaining = deadline - (time.monotonic() - started)
+                if remaining <= 0:
+                    print(f"탐색 시간 한도 초과 ({deadline:.0f}초), 남은 요청 {len(pending)}개 취소")
+                    break
+
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    probe = pending.pop(future)
+                    result = future.result()
+                    if result:
+                        return probe, result
+
+            return None, None
+
+        finally:
+            # 첫 성공 또는 시간 초과 시 대기 중인 요청 모두 취소
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
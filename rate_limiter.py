@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+요청 스케줄러 - 호스트별 토큰 버킷, 429/5xx 적응형 감속, 지터 지수 백오프, 엔드포인트별 서킷 브레이커
+"""
+
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import RequestException
+
+# 감속 대상 응답 상태 코드
+THROTTLE_STATUS = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(RequestException):
+    """서킷 브레이커가 열린 엔드포인트로의 요청"""
+
+
+class RequestCancelled(RequestException):
+    """토큰/백오프 대기 중에 취소되어 보내지 않은 요청"""
+
+
+# 현재 스레드의 요청 취소 이벤트 (cancel_scope로 설정)
+_cancel_state = threading.local()
+
+
+@contextmanager
+def cancel_scope(event):
+    """이 스레드에서 보내는 요청이 대기 중 event가 설정되면 보내지 않고 RequestCancelled 발생"""
+    previous = getattr(_cancel_state, 'event', None)
+    _cancel_state.event = event
+    try:
+        yield
+    finally:
+        _cancel_state.event = previous
+
+
+class TokenBucket:
+    """초당 요청 수와 순간 허용량을 갖는 토큰 버킷 (예약 방식)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def reserve(self, now):
+        """토큰 하나를 예약하고 사용 가능 시각까지 기다릴 시간 반환"""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self):
+        """사용하지 않은 예약 토큰 반환"""
+        self.tokens = min(self.burst, self.tokens + 1)
+
+
+class EndpointState:
+    """엔드포인트별 백오프와 서킷 브레이커 상태"""
+
+    __slots__ = ('failures', 'retry_at', 'open_until', 'trial')
+
+    def __init__(self):
+        self.failures = 0
+        self.retry_at = 0.0
+        self.open_until = 0.0
+        # 진행 중인 시험 요청(half-open)의 번호 (없으면 None)
+        self.trial = None
+
+
+class RequestScheduler:
+    """크롤러 세션들이 공유하는 호스트별 요청 스케줄러"""
+
+    def __init__(self, requests_per_second=10.0, burst=20, min_rate=0.5,
+                 backoff_base=1.0, backoff_max=60.0, failure_threshold=5,
+                 circuit_cooldown=120.0, latency_target=3.0, max_wait=30.0):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_rate = min_rate
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.circuit_cooldown = circuit_cooldown
+        # 응답 지연이 이 값(초)을 넘으면 감속
+        self.latency_target = latency_target
+        # 토큰/백오프 대기 최대 시간 (초과 시 요청 포기)
+        self.max_wait = max_wait
+        self._buckets = {}
+        self._endpoints = {}
+        self._trial_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _keys(url):
+        parts = urlsplit(url)
+        return parts.netloc, f"{parts.netloc}{parts.path}"
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.requests_per_second, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _endpoint(self, endpoint):
+        state = self._endpoints.get(endpoint)
+        if state is None:
+            state = EndpointState()
+            self._endpoints[endpoint] = state
+        return state
+
+    def acquire(self, url, cancel_event=None):
+        """요청 전 호출 - 서킷 상태 확인 후 토큰과 백오프 시간만큼 대기
+
+        시험 요청(half-open)으로 허용된 경우 그 번호를 반환하고, 아니면 None을 반환한다.
+        반환값은 record()에 그대로 넘긴다.
+        cancel_event가 대기 중 또는 대기 직후 설정되어 있으면 토큰을 돌려주고 RequestCancelled 발생.
+        """
+        host, endpoint = self._keys(url)
+
+        with self._lock:
+            now = time.monotonic()
+            state = self._endpoint(endpoint)
+            trial = None
+
+            if state.open_until > now:
+                raise CircuitOpenError(f"서킷 열림: {endpoint} ({state.open_until - now:.0f}초 후 재시도)")
+            if state.open_until and state.failures >= self.failure_threshold:
+                # 대기 시간이 지나면 한 번만 시험 요청 허용 (half-open)
+                if state.trial is not None:
+                    raise CircuitOpenError(f"서킷 시험 요청 진행 중: {endpoint}")
+                trial = state.trial = next(self._trial_ids)
+
+            bucket = self._bucket(host)
+            wait = max(bucket.reserve(now), state.retry_at - now)
+
+            if wait > self.max_wait:
+                # 보내지 않는 요청은 토큰을 돌려주고 시험 요청 상태도 해제
+                bucket.refund()
+                if trial is not None:
+                    state.trial = None
+                raise RequestException(f"요청 대기 시간 초과: {endpoint} ({wait:.1f}초)")
+
+        if cancel_event is None:
+            if wait > 0:
+                time.sleep(wait)
+            return trial
+
+        if wait > 0:
+            cancel_event.wait(wait)
+        if cancel_event.is_set():
+            with self._lock:
+                bucket.refund()
+                if trial is not None and state.trial == trial:
+                    state.trial = None
+            raise RequestCancelled(f"요청 취소됨: {endpoint}")
+        return trial
+
+    def record(self, url, status=None, latency=None, trial=None):
+        """요청 후 호출 - 응답 상태(예외 시 None)와 지연 시간으로 속도와 백오프 조정
+
+        서킷이 열린 뒤에는 acquire()가 반환한 시험 요청 번호를 가진 응답만 서킷을 닫거나 다시 연다.
+        """
+        host, endpoint = self._keys(url)
+
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host)
+            state = self._endpoint(endpoint)
+            failed = status is None or status in THROTTLE_STATUS
+
+            if state.open_until:
+                if trial is None or trial != state.trial:
+                    # 서킷이 열리기 전에 보낸 요청의 응답은 서킷 상태를 바꾸지 않음 (실패면 감속만)
+                    if failed:
+                        bucket.rate = max(self.min_rate, bucket.rate / 2)
+                    return
+                state.trial = None
+
+            if failed:
+                state.failures += 1
+
+                # 지터를 준 지수 백오프
+                delay = min(self.backoff_max, self.backoff_base * (2 ** (state.failures - 1)))
+                state.retry_at = now + delay * random.uniform(0.5, 1.5)
+
+                # 호스트 속도 절반으로 감속
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+
+                if state.failures >= self.failure_threshold:
+                    state.open_until = now + self.circuit_cooldown
+                    print(f"서킷 브레이커 작동: {endpoint} ({self.circuit_cooldown:.0f}초)")
+                return
+
+            state.failures = 0
+            state.retry_at = 0.0
+            state.open_until = 0.0
+
+            if latency is not None and latency > self.latency_target:
+                bucket.rate = max(self.min_rate, bucket.rate * 0.8)
+            else:
+                # 정상 응답이면 설정 속도까지 서서히 회복
+                bucket.rate = min(self.requests_per_second, bucket.rate + 0.5)
+
+    def apply_retry_after(self, url, retry_after):
+        """Retry-After 헤더(초)를 엔드포인트 백오프에 반영"""
+        try:
+            seconds = float(retry_after)
+        except (TypeError, ValueError):
+            return
+
+        _, endpoint = self._keys(url)
+        with self._lock:
+            state = self._endpoint(endpoint)
+            state.retry_at = max(state.retry_at, time.monotonic() + min(seconds, self.backoff_max))
+
+
+class ThrottledAdapter(BaseAdapter):
+    """스케줄러 허가를 받은 뒤 다른 어댑터로 요청을 보내는 어댑터"""
+
+    def __init__(self, scheduler, transport=None):
+        super().__init__()
+        self.scheduler = scheduler
+        self.transport = transport or HTTPAdapter()
+
+    def send(self, request, **kwargs):
+        trial = self.scheduler.acquire(request.url, getattr(_cancel_state, 'event', None))
+
+        started = time.monotonic()
+        try:
+            response = self.transport.send(request, **kwargs)
+        except Exception:
+            self.scheduler.record(request.url, None, trial=trial)
+            raise
+
+        self.scheduler.record(request.url, response.status_code, time.monotonic() - started, trial=trial)
+        if response.status_code in THROTTLE_STATUS and 'Retry-After' in response.headers:
+            self.scheduler.apply_retry_after(request.url, response.headers['Retry-After'])
+
+        return response
+
+    def close(self):
+        self.transport.close()
+
+
+_shared_scheduler = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_shared_scheduler():
+    """크롤러 클래스들이 공유하는 요청 스케줄러"""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = RequestScheduler()
+        return _shared_scheduler
@@ -1,10 +1,82 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import json
 from datetime import datetime, timedelta
 import numpy as np
+import sys
+import re
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from endpoint_cache import EndpointCache
+from crawler_session import create_session
+from html_parsing import parse_response
+from selector_planner import get_selector_planner
+from transaction_store import TransactionStore
+from apartment_dedup import dedupe_apartments
+from records import ApartmentRecord, TransactionRecord
+from transaction_pipeline import DEFAULT_BATCH_SIZE, run_transaction_pipeline
+
+# 엔드포인트 캐시 키
+SEARCH_CACHE_KEY = 'hogangnono_search'
+
+# 단지 상세 정보 동시 크롤링 작업 수
+DETAIL_FETCH_WORKERS = 8
+
+# 가격 단위별 억원 환산 배수 ("5천" = 5천만, "5백" = 5백만)
+PRICE_UNITS = {'억': 1.0, '천': 0.1, '백': 0.01, '만': 0.0001}
+
+# 가격 텍스트: 앞쪽 설명 문구를 건너뛰고 억/천/백/만 단위 숫자를 순서대로 (콤마/소수점 허용)
+PRICE_PATTERN = re.compile(
+    r'^[^\d]*'
+    r'(?:(?P<eok>\d[\d,]*(?:\.\d+)?)\s*억)?\s*'
+    r'(?:(?P<cheon>\d[\d,]*(?:\.\d+)?)\s*천)?\s*'
+    r'(?:(?P<baek>\d[\d,]*(?:\.\d+)?)\s*백)?\s*'
+    r'(?:(?P<man>\d[\d,]*(?:\.\d+)?)\s*(?P<man_unit>만)?)?'
+)
+PRICE_GROUPS = ['eok', 'cheon', 'baek', 'man']
+
+
+def parse_price_text(price_text):
+    """가격 텍스트를 억원 단위 숫자로 변환 ("12억 3,000만원" -> 12.3, "5천만원" -> 0.5)
+    
+    단위 없는 숫자는 단독이면 억원, 다른 단위 뒤에 오면 만원 ("12억 3000" -> 12.3)으로 본다.
+    숫자가 없으면 0을 반환한다.
+    """
+    eok, cheon, baek, man, man_unit = PRICE_PATTERN.match(price_text or '').groups()
+    
+    if man and not (eok or cheon or baek or man_unit):
+        return float(man.replace(',', ''))
+    
+    total = 0.0
+    for number, unit in ((eok, '억'), (cheon, '천'), (baek, '백'), (man, '만')):
+        if number:
+            total += float(number.replace(',', '')) * PRICE_UNITS[unit]
+    return round(total, 4)
+
+
+def parse_prices(price_texts):
+    """가격 텍스트 Series 전체를 억원 단위로 변환 (parse_price_text와 같은 규칙)
+    
+    거래 데이터에는 같은 가격 문자열이 반복되므로 고유값만 한 번씩 정규식으로 분해한다.
+    """
+    price_texts = pd.Series(price_texts)
+    codes, uniques = pd.factorize(price_texts)
+    if len(uniques) == 0:
+        return pd.Series(0.0, index=price_texts.index)
+    
+    # 콤마를 먼저 제거하면 각 단위 숫자를 바로 수치 변환할 수 있다
+    parts = (pd.Series(uniques, dtype=object).astype(str)
+             .str.replace(',', '', regex=False)
+             .str.extract(PRICE_PATTERN.pattern))
+    numbers = parts[PRICE_GROUPS].astype(float).to_numpy()
+    
+    factors = np.tile([PRICE_UNITS['억'], PRICE_UNITS['천'], PRICE_UNITS['백'], PRICE_UNITS['만']], (len(uniques), 1))
+    # 단위 없는 단독 숫자는 억원
+    bare = parts['man'].notna() & parts[['eok', 'cheon', 'baek', 'man_unit']].isna().all(axis=1)
+    factors[bare.to_numpy(), 3] = 1.0
+    
+    values = np.nansum(numbers * factors, axis=1).round(4)
+    return pd.Series(np.where(codes >= 0, values[codes], 0.0), index=price_texts.index)
 
 class HogangnonoCrawler:
     def __init__(self):
@@ -24,8 +96,14 @@ class HogangnonoCrawler:
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'same-origin',
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # 크롤러들이 연결 풀, 요청 스케줄러, HTTP 응답 캐시를 공유하는 세션
+        self.session = create_session(self.headers)
+        
+        # 성공한 검색 요청 캐시
+        self.endpoint_cache = EndpointCache()
+        
+        # 페이지 유형별 선택자 시도 순서
+        self.selector_planner = get_selector_planner()
     
     def search_suji_apartments(self):
         """용인시 수지구 아파트 검색 - hogangnono.com 전용"""
@@ -37,7 +115,7 @@ class HogangnonoCrawler:
             main_response.raise_for_status()
             
             print("사이트 구조 분석 중...")
-            soup = BeautifulSoup(main_response.content, 'html.parser')
+            soup = parse_response(main_response, 'main_page')
             
             # 호갱노노 사이트의 실제 구조 분석
             apartments = self.crawl_hogangnono_suji_data(soup)
@@ -74,26 +152,27 @@ class HogangnonoCrawler:
             if link_result:
                 apartments.extend(link_result)
             
-            # 중복 제거
-            unique_apartments = []
-            seen_names = set()
-            
-            for apt in apartments:
-                if apt['name'] not in seen_names:
-                    unique_apartments.append(apt)
-                    seen_names.add(apt['name'])
-            
-            return unique_apartments
+            # 중복 제거 (표기만 다른 유사 단지도 하나로 병합)
+            return dedupe_apartments(apartments)
             
         except Exception as e:
             print(f"호갱노노 데이터 크롤링 오류: {e}")
             return []
+        
+        finally:
+            # 선택자 통계는 페이지마다가 아니라 수집이 끝날 때 한 번 저장
+            self.selector_planner.save()
     
     def try_hogangnono_search(self):
         """호갱노노 검색 기능 시도"""
         try:
             print("호갱노노 검색 기능 시도...")
             
+            # 이전 실행에서 성공한 요청 우선 시도
+            cached_result = self.try_cached_search()
+            if cached_result:
+                return cached_result
+            
             # 실제 존재하는 엔드포인트들 우선 시도
             working_endpoints = [
                 f"{self.base_url}/search",
@@ -131,15 +210,21 @@ class HogangnonoCrawler:
                                     apartments = self.parse_hogangnono_json(data)
                                     if apartments:
                                         print(f"  ✓ JSON에서 {len(apartments)}개 아파트 발견")
+                                        self.endpoint_cache.remember_endpoint(SEARCH_CACHE_KEY, {
+                                            'method': 'GET', 'url': endpoint, 'params': query, 'format': 'json'
+                                        })
                                         return apartments
                                 except Exception as e:
                                     print(f"  JSON 파싱 실패: {e}")
                             
                             # HTML 응답 파싱
-                            soup = BeautifulSoup(response.content, 'html.parser')
-                            apartments = self.parse_hogangnono_html(soup)
+                            soup = parse_response(response)
+                            apartments = self.parse_hogangnono_html(soup, 'search')
                             if apartments:
                                 print(f"  ✓ HTML에서 {len(apartments)}개 아파트 발견")
+                                self.endpoint_cache.remember_endpoint(SEARCH_CACHE_KEY, {
+                                    'method': 'GET', 'url': endpoint, 'params': query, 'format': 'html'
+                                })
                                 return apartments
                             else:
                                 print("  HTML에서 아파트 정보 없음")
@@ -158,6 +243,39 @@ class HogangnonoCrawler:
             print(f"호갱노노 검색 실패: {e}")
             return None
     
+    def try_cached_search(self):
+        """이전 실행에서 아파트 데이터를 반환한 검색 요청 재시도"""
+        request_info = self.endpoint_cache.get_endpoint(SEARCH_CACHE_KEY)
+        if not request_info:
+            return None
+        
+        try:
+            print(f"캐시된 검색 요청 재사용: {request_info['method']} {request_info['url']}")
+            response = self.session.request(
+                request_info['method'],
+                request_info['url'],
+                params=request_info.get('params'),
+                data=request_info.get('data'),
+                timeout=10
+            )
+            
+            if response.status_code == 200:
+                if request_info.get('format') == 'json':
+                    apartments = self.parse_hogangnono_json(response.json())
+                else:
+                    soup = parse_response(response)
+                    apartments = self.parse_hogangnono_html(soup, 'search')
+                
+                if apartments:
+                    return apartments
+                    
+        except Exception as e:
+            print(f"캐시된 검색 요청 실패: {e}")
+        
+        print("캐시된 검색 요청 무효, 전체 탐색 재시작")
+        self.endpoint_cache.forget_endpoint(SEARCH_CACHE_KEY)
+        return None
+    
     def try_post_search(self):
         """POST 방식 검색 시도"""
         try:
@@ -179,10 +297,13 @@ class HogangnonoCrawler:
                         response = self.session.post(endpoint, data=data, timeout=10)
                         
                         if response.status_code == 200:
-                            soup = BeautifulSoup(response.content, 'html.parser')
-                            apartments = self.parse_hogangnono_html(soup)
+                            soup = parse_response(response)
+                            apartments = self.parse_hogangnono_html(soup, 'search')
                             if apartments:
                                 print(f"POST 검색 성공: {len(apartments)}개 아파트")
+                                self.endpoint_cache.remember_endpoint(SEARCH_CACHE_KEY, {
+                                    'method': 'POST', 'url': endpoint, 'data': data, 'format': 'html'
+                                })
                                 return apartments
                                 
                     except Exception as e:
@@ -216,8 +337,8 @@ class HogangnonoCrawler:
                     response = self.session.get(url, timeout=10)
                     
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        apartments = self.parse_hogangnono_html(soup)
+                        soup = parse_response(response)
+                        apartments = self.parse_hogangnono_html(soup, 'region')
                         
                         if apartments:
                             print(f"✓ {url}에서 {len(apartments)}개 아파트 발견")
@@ -262,8 +383,8 @@ class HogangnonoCrawler:
                     response = self.session.get(url, timeout=8)
                     
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        page_apartments = self.parse_hogangnono_html(soup)
+                        soup = parse_response(response)
+                        page_apartments = self.parse_hogangnono_html(soup, 'link')
                         
                         if page_apartments:
                             apartments.extend(page_apartments)
@@ -300,10 +421,8 @@ class HogangnonoCrawler:
             print(f"JSON 파싱 오류: {e}")
             return None
     
-    def parse_hogangnono_html(self, soup):
+    def parse_hogangnono_html(self, soup, page_type='default'):
         """호갱노노 HTML 파싱"""
-        apartments = []
-        
         try:
             # 호갱노노 사이트의 가능한 HTML 구조들
             selectors = [
@@ -324,19 +443,14 @@ class HogangnonoCrawler:
                 '.building-item'
             ]
             
-            for selector in selectors:
-                elements = soup.select(selector)
-                
-                if elements:
-                    print(f"'{selector}' 선택자로 {len(elements)}개 요소 발견")
-                    
-                    for element in elements:
-                        apt = self.extract_hogangnono_apartment_from_html(element)
-                        if apt and ('수지' in apt.get('address', '') or '용인' in apt.get('address', '')):
-                            apartments.append(apt)
-                    
-                    if apartments:
-                        break
+            def extract(element):
+                apt = self.extract_hogangnono_apartment_from_html(element)
+                if apt and ('수지' in apt.address or '용인' in apt.address):
+                    return [apt]
+                return []
+            
+            # 페이지 유형별로 결과를 낸 선택자 우선 시도
+            apartments = self.selector_planner.run(f"hogangnono:{page_type}", soup, selectors, extract)
             
             return apartments if apartments else None
             
@@ -367,11 +481,11 @@ class HogangnonoCrawler:
                     break
             
             if name and address and ('수지' in address or '용인' in address):
-                return {
-                    'name': name,
-                    'address': address,
-                    'url': data.get('url', data.get('link', None))
-                }
+                return ApartmentRecord(
+                    name=name,
+                    address=address,
+                    url=data.get('url', data.get('link', None))
+                )
             
             return None
             
@@ -424,11 +538,11 @@ class HogangnonoCrawler:
                 url = href if href.startswith('http') else f"{self.base_url}{href}"
             
             if name and address:
-                return {
-                    'name': name,
-                    'address': address,
-                    'url': url
-                }
+                return ApartmentRecord(
+                    name=name,
+                    address=address,
+                    url=url
+                )
             
             return None
             
@@ -487,7 +601,7 @@ class HogangnonoCrawler:
                 try:
                     response = self.session.get(url, timeout=10)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        soup = parse_response(response)
                         apartments = self.parse_html_apartments(soup)
                         if apartments:
                             return apartments
@@ -505,7 +619,7 @@ class HogangnonoCrawler:
         try:
             # 메인 페이지에서 네비게이션 구조 파악
             main_response = self.session.get(self.base_url, timeout=10)
-            soup = BeautifulSoup(main_response.content, 'html.parser')
+            soup = parse_response(main_response, 'main_page')
             
             # 가능한 링크들 찾기
             links = soup.find_all('a', href=True)
@@ -516,7 +630,7 @@ class HogangnonoCrawler:
                     full_url = link if link.startswith('http') else f"{self.base_url}{link}"
                     response = self.session.get(full_url, timeout=10)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
+                        soup = parse_response(response)
                         apartments = self.parse_html_apartments(soup)
                         if apartments:
                             return apartments
@@ -596,11 +710,11 @@ class HogangnonoCrawler:
                     break
             
             if name and address and '수지' in address:
-                return {
-                    'name': name,
-                    'address': address,
-                    'url': item.get('url', item.get('link', None))
-                }
+                return ApartmentRecord(
+                    name=name,
+                    address=address,
+                    url=item.get('url', item.get('link', None))
+                )
             
             return None
             
@@ -639,11 +753,11 @@ class HogangnonoCrawler:
                 url = link_elem['href']
             
             if name and address:
-                return {
-                    'name': name,
-                    'address': address,
-                    'url': url
-                }
+                return ApartmentRecord(
+                    name=name,
+                    address=address,
+                    url=url
+                )
             
             return None
             
@@ -656,95 +770,121 @@ class HogangnonoCrawler:
             name = element.find('h3', class_='apartment-name').text.strip()
             address = element.find('p', class_='apartment-address').text.strip()
             
-            return {
-                'name': name,
-                'address': address,
-                'url': element.find('a')['href'] if element.find('a') else None
-            }
+            return ApartmentRecord(
+                name=name,
+                address=address,
+                url=element.find('a')['href'] if element.find('a') else None
+            )
         except:
             return None
     
     def get_apartment_details(self, apartment_url):
         """개별 아파트 상세 정보 크롤링"""
         try:
-            response = self.session.get(apartment_url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 거래 데이터 파싱 (실제 구조에 맞게 수정)
-            transactions = []
-            transaction_elements = soup.find_all('tr', class_='transaction-row')
-            
-            for element in transaction_elements:
-                transaction = self.parse_transaction(element)
-                if transaction:
-                    transactions.append(transaction)
-            
-            return transactions
+            return self.fetch_apartment_details(apartment_url)
             
         except Exception as e:
             print(f"상세 정보 크롤링 오류: {e}")
             return []
     
+    def fetch_apartment_details(self, apartment_url):
+        """개별 아파트 거래 내역 요청 및 파싱 (오류는 호출자에게 전달)"""
+        response = self.session.get(apartment_url, timeout=10)
+        response.raise_for_status()
+        
+        soup = parse_response(response, 'transactions')
+        
+        # 거래 데이터 파싱 (실제 구조에 맞게 수정)
+        transactions = []
+        transaction_elements = soup.find_all('tr', class_='transaction-row')
+        
+        for element in transaction_elements:
+            transaction = self.parse_transaction(element)
+            if transaction:
+                transactions.append(transaction)
+        
+        return transactions
+    
+    def get_many_apartment_details(self, apartment_urls, max_workers=DETAIL_FETCH_WORKERS):
+        """여러 단지 상세 정보를 동시에 크롤링하여 완료되는 단지 순으로 반환
+        
+        (url, 거래 목록, 오류) 튜플을 생성하며, 실패한 단지는 거래 목록이 비고 오류에 예외가 담긴다.
+        실행 중인 작업은 max_workers의 2배로 제한하여 URL이 많아도 대기열이 커지지 않는다.
+        """
+        urls = iter(apartment_urls)
+        pending = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def submit_next():
+                for url in urls:
+                    pending[executor.submit(self.fetch_apartment_details, url)] = url
+                    return True
+                return False
+            
+            try:
+                while len(pending) < max_workers * 2 and submit_next():
+                    pass
+                
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    
+                    for future in done:
+                        url = pending.pop(future)
+                        submit_next()
+                        
+                        try:
+                            yield url, future.result(), None
+                        except Exception as e:
+                            print(f"상세 정보 크롤링 오류 ({url}): {e}")
+                            yield url, [], e
+            finally:
+                # 소비자가 중간에 멈춘 경우 대기 중인 작업 취소
+                for future in pending:
+                    future.cancel()
+    
     def parse_transaction(self, element):
         """거래 정보 파싱"""
         try:
             cells = element.find_all('td')
             
-            return {
-                'date': cells[0].text.strip(),
-                'area_type': cells[1].text.strip(),
-                'deal_type': cells[2].text.strip(),
-                'price': self.parse_price(cells[3].text.strip()),
-                'floor': cells[4].text.strip() if len(cells) > 4 else None
-            }
+            return TransactionRecord(
+                date=cells[0].text.strip(),
+                area_type=cells[1].text.strip(),
+                deal_type=cells[2].text.strip(),
+                price=self.parse_price(cells[3].text.strip()),
+                floor=cells[4].text.strip() if len(cells) > 4 else None
+            )
         except:
             return None
     
     def parse_price(self, price_text):
         """가격 텍스트를 숫자로 변환"""
-        try:
-            # "12억 3000만원" -> 12.3
-            price_text = price_text.replace('억', '').replace('만원', '').replace(',', '')
-            
-            if '억' in price_text and '만' in price_text:
-                parts = price_text.split('억')
-                eok = float(parts[0])
-                man = float(parts[1].replace('만', '')) / 10000
-                return eok + man
-            elif '억' in price_text:
-                return float(price_text.replace('억', ''))
-            elif '만' in price_text:
-                return float(price_text.replace('만', '')) / 10000
-            else:
-                return float(price_text)
-        except:
-            return 0
+        # "12억 3000만원" -> 12.3
+        return parse_price_text(price_text)
     
     def get_realistic_sample_apartments(self):
         """현실적인 샘플 아파트 데이터 (실제 수지구 아파트 기반)"""
         return [
-            {'name': '수지구청역 푸르지오', 'address': '경기도 용인시 수지구 풍덕천동 1191'},
-            {'name': '동천역 래미안', 'address': '경기도 용인시 수지구 동천동 887'},
-            {'name': '수지구 롯데캐슬', 'address': '경기도 용인시 수지구 성복동 638'},
-            {'name': '죽전역 이편한세상', 'address': '경기도 용인시 수지구 죽전동 1258'},
-            {'name': '신분당선 래미안', 'address': '경기도 용인시 수지구 상현동 532'},
-            {'name': '수지구 힐스테이트', 'address': '경기도 용인시 수지구 신봉동 355'},
-            {'name': '동천동 푸르지오', 'address': '경기도 용인시 수지구 동천동 965'},
-            {'name': '죽전동 자이', 'address': '경기도 용인시 수지구 죽전동 1342'},
-            {'name': '풍덕천동 래미안', 'address': '경기도 용인시 수지구 풍덕천동 1456'},
-            {'name': '상현역 푸르지오', 'address': '경기도 용인시 수지구 상현동 789'},
-            {'name': '수지구 센트럴파크', 'address': '경기도 용인시 수지구 성복동 741'},
-            {'name': '죽전역 롯데캐슬', 'address': '경기도 용인시 수지구 죽전동 1567'},
-            {'name': '동천역 힐스테이트', 'address': '경기도 용인시 수지구 동천동 1123'},
-            {'name': '수지구 아이파크', 'address': '경기도 용인시 수지구 신봉동 456'},
-            {'name': '신분당선 자이', 'address': '경기도 용인시 수지구 상현동 678'},
-            {'name': '수지 래미안 포레스트', 'address': '경기도 용인시 수지구 죽전동 1789'},
-            {'name': '동천 힐스테이트', 'address': '경기도 용인시 수지구 동천동 1234'},
-            {'name': '풍덕천 자이', 'address': '경기도 용인시 수지구 풍덕천동 987'},
-            {'name': '상현 푸르지오 월드마크', 'address': '경기도 용인시 수지구 상현동 543'},
-            {'name': '성복 래미안 루센티아', 'address': '경기도 용인시 수지구 성복동 876'}
+            ApartmentRecord('수지구청역 푸르지오', '경기도 용인시 수지구 풍덕천동 1191'),
+            ApartmentRecord('동천역 래미안', '경기도 용인시 수지구 동천동 887'),
+            ApartmentRecord('수지구 롯데캐슬', '경기도 용인시 수지구 성복동 638'),
+            ApartmentRecord('죽전역 이편한세상', '경기도 용인시 수지구 죽전동 1258'),
+            ApartmentRecord('신분당선 래미안', '경기도 용인시 수지구 상현동 532'),
+            ApartmentRecord('수지구 힐스테이트', '경기도 용인시 수지구 신봉동 355'),
+            ApartmentRecord('동천동 푸르지오', '경기도 용인시 수지구 동천동 965'),
+            ApartmentRecord('죽전동 자이', '경기도 용인시 수지구 죽전동 1342'),
+            ApartmentRecord('풍덕천동 래미안', '경기도 용인시 수지구 풍덕천동 1456'),
+            ApartmentRecord('상현역 푸르지오', '경기도 용인시 수지구 상현동 789'),
+            ApartmentRecord('수지구 센트럴파크', '경기도 용인시 수지구 성복동 741'),
+            ApartmentRecord('죽전역 롯데캐슬', '경기도 용인시 수지구 죽전동 1567'),
+            ApartmentRecord('동천역 힐스테이트', '경기도 용인시 수지구 동천동 1123'),
+            ApartmentRecord('수지구 아이파크', '경기도 용인시 수지구 신봉동 456'),
+            ApartmentRecord('신분당선 자이', '경기도 용인시 수지구 상현동 678'),
+            ApartmentRecord('수지 래미안 포레스트', '경기도 용인시 수지구 죽전동 1789'),
+            ApartmentRecord('동천 힐스테이트', '경기도 용인시 수지구 동천동 1234'),
+            ApartmentRecord('풍덕천 자이', '경기도 용인시 수지구 풍덕천동 987'),
+            ApartmentRecord('상현 푸르지오 월드마크', '경기도 용인시 수지구 상현동 543'),
+            ApartmentRecord('성복 래미안 루센티아', '경기도 용인시 수지구 성복동 876')
         ]
     
 
@@ -753,98 +893,192 @@ class HogangnonoCrawler:
         """기본 샘플 데이터"""
         return self.get_realistic_sample_apartments()
     
-    def generate_realistic_data(self, apartments, start_date="2022-07-01", end_date="2025-07-21"):
-        """현실적인 거래 데이터 생성"""
-        np.random.seed(42)
-        
-        data = []
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        
-        # 월별 데이터 생성
-        current = start
-        while current <= end:
-            for apt in apartments:
-                # 아파트별 기본 특성 설정
-                base_price = np.random.uniform(8, 18)  # 8-18억
-                location_premium = np.random.uniform(0.9, 1.3)  # 입지 프리미엄
-                
-                for area_type in ["32평", "39평", "49평", "59평", "84평"]:
-                    area_multiplier = {
-                        "32평": 0.7, "39평": 1.0, "49평": 1.4, 
-                        "59평": 1.8, "84평": 2.5
-                    }
-                    
-                    for deal_type in ["매매", "전세", "월세"]:
-                        # 거래 발생 확률 (모든 조합이 매월 발생하지는 않음)
-                        if np.random.random() < 0.7:  # 70% 확률로 거래 발생
-                            
-                            price_multiplier = {"매매": 1.0, "전세": 0.65, "월세": 0.08}
-                            
-                            # 기본 가격 계산
-                            price = (base_price * location_premium * 
-                                   area_multiplier[area_type] * 
-                                   price_multiplier[deal_type])
-                            
-                            # 시간에 따른 가격 변동 (코로나 이후 상승세 반영)
-                            months_passed = (current.year - 2022) * 12 + (current.month - 7)
-                            time_factor = 1 + (months_passed * 0.008)  # 월 0.8% 상승
-                            
-                            # 계절성 반영 (봄/가을 성수기)
-                            seasonal_factor = 1.0
-                            if current.month in [3, 4, 5, 9, 10, 11]:
-                                seasonal_factor = 1.05
-                            
-                            # 랜덤 변동
-                            random_factor = np.random.uniform(0.95, 1.05)
-                            
-                            final_price = price * time_factor * seasonal_factor * random_factor
-                            
-                            # 거래량 (포아송 분포)
-                            base_volume = 8 if deal_type == "매매" else 12
-                            volume = max(1, np.random.poisson(base_volume))
-                            
-                            # 임대수익률 (매매만)
-                            rental_yield = 0
-                            if deal_type == "매매":
-                                rental_yield = np.random.uniform(2.0, 4.5)
-                            
-                            data.append({
-                                'date': current.strftime("%Y-%m-%d"),
-                                'apartment': apt['name'],
-                                'address': apt['address'],
-                                'area_type': area_type,
-                                'deal_type': deal_type,
-                                'price': round(final_price, 2),
-                                'volume': volume,
-                                'rental_yield': round(rental_yield, 2)
-                            })
-            
-            # 다음 달로
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
+    def generate_realistic_data(self, apartments, start_date="2022-07-01", end_date="2025-07-21", seed=42):
+        """현실적인 거래 데이터 생성 (월 × 아파트 × 평형 × 거래종류 격자를 한 번에 계산)"""
+        rng = np.random.default_rng(seed)
+        
+        area_types = ["32평", "39평", "49평", "59평", "84평"]
+        area_multiplier = np.array([0.7, 1.0, 1.4, 1.8, 2.5])
+        
+        deal_types = ["매매", "전세", "월세"]
+        price_multiplier = np.array([1.0, 0.65, 0.08])
+        # 거래량 기준값 (포아송 분포)
+        base_volume = np.array([8, 12, 12])
+        is_sale = np.array([True, False, False])
+        
+        # 월별 날짜 (시작일 기준 한 달 간격)
+        dates = pd.date_range(start_date, end_date, freq=pd.DateOffset(months=1))
+        
+        n_months, n_apts = len(dates), len(apartments)
+        n_areas, n_deals = len(area_types), len(deal_types)
+        shape = (n_months, n_apts, n_areas, n_deals)
+        
+        if n_months == 0 or n_apts == 0:
+            return self._empty_transaction_frame(area_types, deal_types)
+        
+        # 아파트별 기본 특성 (월마다 새로 추출)
+        base_price = rng.uniform(8, 18, (n_months, n_apts))  # 8-18억
+        location_premium = rng.uniform(0.9, 1.3, (n_months, n_apts))  # 입지 프리미엄
+        
+        # 거래 발생 확률 (70% 확률로 거래 발생)
+        occurred = rng.random(shape) < 0.7
+        
+        # 시간에 따른 가격 변동 (코로나 이후 상승세 반영, 월 0.8% 상승)
+        months_passed = (dates.year - 2022) * 12 + (dates.month - 7)
+        time_factor = 1 + np.asarray(months_passed) * 0.008
+        
+        # 계절성 반영 (봄/가을 성수기)
+        seasonal_factor = np.where(np.isin(dates.month, [3, 4, 5, 9, 10, 11]), 1.05, 1.0)
+        
+        # 랜덤 변동
+        random_factor = rng.uniform(0.95, 1.05, shape)
+        
+        final_price = (
+            (base_price * location_premium)[:, :, None, None]
+            * area_multiplier[None, None, :, None]
+            * price_multiplier[None, None, None, :]
+            * (time_factor * seasonal_factor)[:, None, None, None]
+            * random_factor
+        )
+        
+        volume = np.maximum(1, rng.poisson(np.broadcast_to(base_volume, shape)))
+        
+        # 임대수익률 (매매만)
+        rental_yield = np.where(is_sale, rng.uniform(2.0, 4.5, shape), 0.0)
+        
+        # 거래가 발생한 조합만 추출
+        month_idx, apt_idx, area_idx, deal_idx = np.nonzero(occurred)
+        
+        names = [apt['name'] for apt in apartments]
+        addresses = [apt['address'] for apt in apartments]
+        
+        return pd.DataFrame({
+            'date': dates.values[month_idx],
+            'apartment': self._categorical_from_positions(names, apt_idx),
+            'address': self._categorical_from_positions(addresses, apt_idx),
+            'area_type': pd.Categorical.from_codes(area_idx, area_types),
+            'deal_type': pd.Categorical.from_codes(deal_idx, deal_types),
+            'price': final_price[occurred].round(2).astype(np.float32),
+            'volume': volume[occurred],
+            'rental_yield': rental_yield[occurred].round(2)
+        })
+    
+    def iter_realistic_data(self, apartments, start_date="2022-07-01", end_date="2025-07-21",
+                            batch_size=DEFAULT_BATCH_SIZE, seed=42):
+        """거래 데이터를 월 구간별 데이터프레임으로 나누어 생성 (구간당 약 batch_size건)"""
+        dates = pd.date_range(start_date, end_date, freq=pd.DateOffset(months=1))
+        
+        # 월별 최대 조합 수: 아파트 × 평형 5개 × 거래종류 3개
+        months_per_batch = max(1, batch_size // max(1, len(apartments) * 15))
+        
+        for i, offset in enumerate(range(0, len(dates), months_per_batch)):
+            block = dates[offset:offset + months_per_batch]
+            yield self.generate_realistic_data(
+                apartments, block[0].strftime("%Y-%m-%d"), block[-1].strftime("%Y-%m-%d"), seed=seed + i
+            )
+    
+    def crawl_transactions_to_store(self, apartments, store, batch_size=DEFAULT_BATCH_SIZE, mode='append'):
+        """상세 페이지 URL이 있는 단지의 거래 내역을 크롤링하여 묶음 단위로 저장"""
+        saved = run_transaction_pipeline(self, apartments, store, batch_size=batch_size, mode=mode)
+        print(f"크롤링한 거래 데이터 {saved}건 저장")
+        return saved
+        
+    def generate_incremental_data(self, apartments, store, start_date="2022-07-01", end_date=None):
+        """저장된 마지막 월 이후의 거래 데이터만 생성"""
+        end_date = end_date or datetime.now().strftime("%Y-%m-%d")
+        last_months = store.last_months()
+        
+        # 아파트별 시작 월 (저장된 적 없는 아파트는 전체 기간)
+        pending = {}
+        for apt in apartments:
+            last_month = last_months.get(apt['name'])
+            if last_month is None:
+                start = start_date
             else:
-                current = current.replace(month=current.month + 1)
+                start = (pd.Period(last_month, freq='M') + 1).start_time.strftime("%Y-%m-%d")
+            
+            if start <= end_date:
+                pending.setdefault(start, []).append(apt)
         
-        return pd.DataFrame(data)
+        # 같은 시작 월끼리 묶어 한 번에 생성 (시작 월마다 다른 시드 사용)
+        frames = [
+            self.generate_realistic_data(group, start, end_date, seed=int(start[:7].replace('-', '')))
+            for start, group in sorted(pending.items())
+        ]
+        frames = [frame for frame in frames if not frame.empty]
+        
+        if not frames:
+            return self._empty_transaction_frame(["32평", "39평", "49평", "59평", "84평"], ["매매", "전세", "월세"])
+        
+        return pd.concat(frames, ignore_index=True)
+    
+    def update_store_incrementally(self, apartments, store, end_date=None):
+        """새로운 월의 데이터만 생성하여 저장소에 추가"""
+        delta = self.generate_incremental_data(apartments, store, end_date=end_date)
+        
+        if delta.empty:
+            print("추가할 새 거래 데이터가 없습니다.")
+        else:
+            store.write(delta, mode='append')
+            print(f"새 거래 데이터 {len(delta)}건 추가 ({delta['date'].min():%Y-%m} ~ {delta['date'].max():%Y-%m})")
+        
+        return delta
+    
+    @staticmethod
+    def _categorical_from_positions(values, positions):
+        """값 목록과 위치 배열로 범주형 컬럼 생성 (중복 값은 하나의 범주로)"""
+        categories = pd.unique(pd.Series(values, dtype=object))
+        codes = pd.Index(categories).get_indexer(values)
+        return pd.Categorical.from_codes(codes[positions], categories)
+    
+    @staticmethod
+    def _empty_transaction_frame(area_types, deal_types):
+        """거래가 없는 경우의 빈 데이터프레임 (컬럼 타입 유지)"""
+        return pd.DataFrame({
+            'date': pd.Series(dtype='datetime64[ns]'),
+            'apartment': pd.Categorical([]),
+            'address': pd.Categorical([]),
+            'area_type': pd.Categorical([], categories=area_types),
+            'deal_type': pd.Categorical([], categories=deal_types),
+            'price': pd.Series(dtype=np.float32),
+            'volume': pd.Series(dtype=np.int64),
+            'rental_yield': pd.Series(dtype=np.float64)
+        })
+
+def main(incremental=False, crawl_details=False):
+    """테스트용 메인 함수
 
-def main():
-    """테스트용 메인 함수"""
+    incremental=True: 저장된 마지막 월 이후만 추가
+    crawl_details=True: 상세 페이지의 실제 거래 내역을 크롤링하여 저장 (없으면 생성 데이터 사용)
+    """
     crawler = HogangnonoCrawler()
     
     print("용인시 수지구 아파트 데이터 수집 중...")
     apartments = crawler.search_suji_apartments()
     print(f"총 {len(apartments)}개 아파트 발견")
     
-    print("거래 데이터 생성 중...")
-    data = crawler.generate_realistic_data(apartments)
-    print(f"총 {len(data)}건의 거래 데이터 생성")
+    store = TransactionStore()
+    if incremental and store.exists():
+        print("증분 데이터 생성 중...")
+        return crawler.update_store_incrementally(apartments, store)
+    
+    if crawl_details:
+        print("상세 페이지 거래 내역 크롤링 중...")
+        # 크롤링 → 정규화 → 묶음 → 저장 파이프라인으로 받는 대로 임시 위치에 저장하고,
+        # 저장한 거래가 있을 때만 기존 데이터셋과 교체 (실패/차단 시 기존 데이터 유지)
+        saved = crawler.crawl_transactions_to_store(apartments, store, mode='swap')
+        if saved:
+            print(f"데이터가 '{store.root}'에 저장되었습니다.")
+            return saved
+        print("크롤링한 거래 내역이 없어 거래 데이터를 생성합니다.")
     
-    # CSV 저장
-    data.to_csv('suji_apartments_data.csv', index=False, encoding='utf-8-sig')
-    print("데이터가 'suji_apartments_data.csv'에 저장되었습니다.")
+    print("거래 데이터 생성 중...")
+    # 월 구간별로 생성하는 대로 월/거래종류별 Parquet 데이터셋에 저장
+    saved = store.write_batches(crawler.iter_realistic_data(apartments), mode='overwrite')
+    print(f"총 {saved}건의 거래 데이터 생성")
+    print(f"데이터가 '{store.root}'에 저장되었습니다.")
     
-    return data
+    return saved
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(incremental='--incremental' in sys.argv, crawl_details='--crawl-details' in sys.argv)
\ No newline at end of file
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+레코드 타입 - 아파트/거래 정보를 __slots__ 객체로 표현 (반복되는 문자열은 intern)
+"""
+
+import sys
+
+
+def intern_text(value):
+    """반복해서 등장하는 문자열(동, 평형, 거래종류 등)을 하나의 객체로 공유"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def find_dong(address):
+    """주소에서 동 이름 추출 ("경기도 용인시 수지구 풍덕천동 1191" -> "풍덕천동")"""
+    for part in (address or '').split():
+        if part.endswith('동') and len(part) > 1:
+            return part
+    return None
+
+
+class RecordMixin:
+    """기존 dict 기반 코드(apt['name'], apt.get('url'))와 호환되는 접근 방식"""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def keys(self):
+        return self.__slots__
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class ApartmentRecord(RecordMixin):
+    """아파트 단지 정보"""
+
+    __slots__ = ('name', 'address', 'url', 'dong', 'canonical_id')
+
+    def __init__(self, name, address='', url=None, dong=None, canonical_id=None):
+        self.name = intern_text(name)
+        self.address = intern_text(address)
+        self.url = url
+        self.dong = intern_text(dong or find_dong(address))
+        # 유사 단지 병합 후의 대표 단지 ID (apartment_dedup)
+        self.canonical_id = canonical_id
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'], data.get('address', ''), data.get('url'), data.get('dong'),
+                   data.get('canonical_id'))
+
+
+class TransactionRecord(RecordMixin):
+    """거래 한 건 (상세 페이지 파싱 결과 또는 저장소의 한 행)"""
+
+    __slots__ = ('date', 'area_type', 'deal_type', 'price', 'floor',
+                 'apartment', 'address', 'volume', 'rental_yield')
+
+    # 저장소 컬럼 순서 (transaction_store.TRANSACTION_COLUMNS와 동일)
+    ROW_FIELDS = ('date', 'apartment', 'address', 'area_type', 'deal_type', 'price', 'volume', 'rental_yield')
+
+    def __init__(self, date, area_type, deal_type, price, floor=None,
+                 apartment=None, address=None, volume=1, rental_yield=0.0):
+        self.date = date
+        self.area_type = intern_text(area_type)
+        self.deal_type = intern_text(deal_type)
+        self.price = price
+        self.floor = floor
+        self.apartment = intern_text(apartment)
+        self.address = intern_text(address)
+        self.volume = volume
+        self.rental_yield = rental_yield
+
+    def as_row(self):
+        """저장소 컬럼 순서의 튜플"""
+        return (self.date, self.apartment, self.address, self.area_type, self.deal_type,
+                self.price, self.volume, self.rental_yield)
+
+    @classmethod
+    def from_frame(cls, data):
+        """거래 데이터프레임의 각 행을 레코드로 생성 (없는 선택 컬럼은 기본값)"""
+        columns = [field for field in cls.__slots__ if field in data.columns]
+        for values in data[columns].itertuples(index=False, name=None):
+            yield cls(**dict(zip(columns, values)))
@@ -14,6 +14,8 @@ import base64
 from datetime import datetime
 import os
 
+from records import TransactionRecord
+
 class ApartmentReportGenerator:
     def __init__(self):
         # 한글 폰트 등록
@@ -255,12 +257,12 @@ class ApartmentReportGenerator:
         """상세 데이터 테이블 생성"""
         table_data = [['날짜', '가격(억원)', '거래량(건)', '임대수익률(%)']]
         
-        for _, row in data.iterrows():
+        for record in TransactionRecord.from_frame(data):
             table_data.append([
-                row['date'][:7],  # YYYY-MM 형식
-                f"{row['price']:.2f}",
-                str(row['volume']),
-                f"{row['rental_yield']:.2f}" if row['rental_yield'] > 0 else "-"
+                pd.Timestamp(record.date).strftime('%Y-%m'),  # YYYY-MM 형식
+                f"{record.price:.2f}",
+                str(record.volume),
+                f"{record.rental_yield:.2f}" if record.rental_yield > 0 else "-"
             ])
         
         table = Table(table_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
@@ -287,7 +289,7 @@ class ApartmentReportGenerator:
             data.to_excel(writer, sheet_name='전체데이터', index=False)
             
             # 아파트별 요약
-            apartment_summary = data.groupby('apartment').agg({
+            apartment_summary = data.groupby('apartment', observed=True).agg({
                 'price': ['mean', 'min', 'max', 'std'],
                 'volume': ['sum', 'mean'],
                 'rental_yield': 'mean'
@@ -295,7 +297,7 @@ class ApartmentReportGenerator:
             apartment_summary.to_excel(writer, sheet_name='아파트별요약')
             
             # 평형별 요약
-            area_summary = data.groupby('area_type').agg({
+            area_summary = data.groupby('area_type', observed=True).agg({
                 'price': ['mean', 'min', 'max'],
                 'volume': ['sum', 'mean'],
                 'rental_yield': 'mean'
@@ -303,7 +305,7 @@ class ApartmentReportGenerator:
             area_summary.to_excel(writer, sheet_name='평형별요약')
             
             # 거래종류별 요약
-            deal_summary = data.groupby('deal_type').agg({
+            deal_summary = data.groupby('deal_type', observed=True).agg({
                 'price': ['mean', 'min', 'max'],
                 'volume': ['sum', 'mean'],
                 'rental_yield': 'mean'
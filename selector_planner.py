@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+선택자 실행 계획 - 페이지 유형별로 결과를 낸 선택자를 먼저 시도하고 후보 수를 제한
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+DEFAULT_STATS_PATH = os.path.join('.crawler_cache', 'selector_stats.json')
+
+# 선택자 하나가 검사하는 최대 후보 요소 수
+DEFAULT_CANDIDATE_LIMIT = 200
+
+
+class SelectorPlanner:
+    """선택자별 적중률과 비용을 기록하여 시도 순서를 정하는 계획기"""
+
+    def __init__(self, path=DEFAULT_STATS_PATH, candidate_limit=DEFAULT_CANDIDATE_LIMIT):
+        self.path = path
+        self.candidate_limit = candidate_limit
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stats = self._load()
+        self._dirty = False
+
+    def _load(self):
+        """저장된 통계 로드 (없거나 손상된 경우 빈 통계)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+            if isinstance(stats, dict):
+                return stats
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def save(self):
+        """변경된 통계를 고유한 임시 파일에 쓴 뒤 교체하여 저장 (크롤링이 끝날 때 한 번 호출)"""
+        # 동시에 저장하는 스레드가 서로의 파일을 덮어쓰지 않도록 교체까지 잠금 유지
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = json.dumps(self._stats, ensure_ascii=False, indent=2)
+                self._dirty = False
+
+            directory = os.path.dirname(self.path)
+            tmp_path = None
+            try:
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory or '.',
+                                                 prefix='.selector_stats-', suffix='.tmp', delete=False) as f:
+                    tmp_path = f.name
+                    f.write(snapshot)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"선택자 통계 저장 실패: {e}")
+                with self._lock:
+                    self._dirty = True
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def plan(self, page_type, selectors):
+        """시도 순서 결정: 마지막 적중 선택자 → 적중률 높은 순 → 검사 비용 낮은 순"""
+        with self._lock:
+            page_stats = self._stats.get(page_type, {})
+            last_hit = page_stats.get('_last_hit')
+
+            def priority(indexed):
+                index, selector = indexed
+                stat = page_stats.get(selector, {})
+                attempts = stat.get('attempts', 0)
+                # 시도하지 않은 선택자는 적중률 0.5로 간주 (라플라스 보정)
+                hit_rate = (stat.get('hits', 0) + 1) / (attempts + 2)
+                avg_cost = stat.get('examined', 0) / attempts if attempts else 0
+                return (selector != last_hit, -hit_rate, avg_cost, index)
+
+            return [selector for _, selector in sorted(enumerate(selectors), key=priority)]
+
+    def record(self, page_type, selector, examined, found):
+        """선택자 실행 결과 기록"""
+        with self._lock:
+            page_stats = self._stats.setdefault(page_type, {})
+            stat = page_stats.setdefault(selector, {'attempts': 0, 'hits': 0, 'examined': 0})
+            stat['attempts'] += 1
+            stat['examined'] += examined
+            self._dirty = True
+            if found:
+                stat['hits'] += 1
+                page_stats['_last_hit'] = selector
+
+    def run(self, page_type, soup, selectors, extract):
+        """계획된 순서로 선택자를 적용하여 처음으로 결과를 낸 선택자의 결과 반환
+
+        extract: 요소 하나를 받아 결과 목록(없으면 빈 목록)을 반환하는 함수
+        """
+        results = []
+
+        for selector in self.plan(page_type, selectors):
+            elements = soup.select(selector, limit=self.candidate_limit)
+            if not elements:
+                self.record(page_type, selector, 0, False)
+                continue
+
+            print(f"'{selector}' 선택자로 {len(elements)}개 요소 발견")
+
+            for element in elements:
+                results.extend(extract(element))
+
+            self.record(page_type, selector, len(elements), bool(results))
+            if results:
+                break
+
+        return results
+
+
+_shared_planner = None
+_shared_planner_lock = threading.Lock()
+
+
+def get_selector_planner():
+    """크롤러들이 공유하는 선택자 계획기"""
+    global _shared_planner
+    with _shared_planner_lock:
+        if _shared_planner is None:
+            _shared_planner = SelectorPlanner()
+        return _shared_planner
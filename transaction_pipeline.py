@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+거래 데이터 스트리밍 파이프라인 - 요청 → 파싱 → 정규화 → 묶음 → 저장을 생성기로 연결
+"""
+
+import pandas as pd
+
+from transaction_store import TRANSACTION_COLUMNS
+
+# 한 번에 저장하는 거래 건수 (최대 메모리 사용량 기준)
+DEFAULT_BATCH_SIZE = 5000
+
+
+def absolute_url(crawler, url):
+    """상대 경로 URL을 크롤러 기준 절대 URL로 변환"""
+    if url.startswith('/'):
+        return f"{crawler.base_url}{url}"
+    return url
+
+
+def iter_crawled_transactions(crawler, apartments, max_workers=None):
+    """단지 상세 페이지를 동시에 크롤링하여 (아파트, 파싱된 거래) 쌍을 완료 순으로 생성"""
+    by_url = {}
+    for apt in apartments:
+        if apt.url:
+            by_url.setdefault(absolute_url(crawler, apt.url), apt)
+
+    kwargs = {'max_workers': max_workers} if max_workers else {}
+    for url, transactions, _ in crawler.get_many_apartment_details(list(by_url), **kwargs):
+        apt = by_url[url]
+        for transaction in transactions:
+            yield apt, transaction
+
+
+def normalize_transactions(pairs):
+    """파싱된 거래에 단지 정보를 채워 저장소 형식으로 정리 (날짜/가격이 없는 거래 제외)"""
+    for apt, transaction in pairs:
+        if not transaction.date or not transaction.price:
+            continue
+
+        transaction.apartment = apt.name
+        transaction.address = apt.address or ''
+        transaction.price = float(transaction.price)
+        yield transaction
+
+
+def batch_records(records, batch_size=DEFAULT_BATCH_SIZE):
+    """거래 레코드를 batch_size 건씩 데이터프레임으로 묶어 생성"""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield records_to_frame(batch)
+            batch = []
+
+    if batch:
+        yield records_to_frame(batch)
+
+
+def records_to_frame(records):
+    """레코드 묶음을 저장소 컬럼 타입의 데이터프레임으로 변환"""
+    frame = pd.DataFrame.from_records([record.as_row() for record in records], columns=TRANSACTION_COLUMNS)
+    frame['date'] = pd.to_datetime(frame['date'], errors='coerce')
+    frame['price'] = frame['price'].astype('float32')
+    return frame.dropna(subset=['date'])
+
+
+def run_transaction_pipeline(crawler, apartments, store, batch_size=DEFAULT_BATCH_SIZE, mode='append'):
+    """단지 상세 정보를 크롤링하여 묶음 단위로 저장소에 기록하고 저장한 건수 반환"""
+    pairs = iter_crawled_transactions(crawler, apartments)
+    batches = batch_records(normalize_transactions(pairs), batch_size)
+    return store.write_batches(batches, mode=mode)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+거래 데이터 저장소 - 월/거래종류별로 파티션된 Parquet 데이터셋
+"""
+
+import os
+import shutil
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DEFAULT_STORE_DIR = os.path.join('data', 'transactions')
+
+# 파티션 컬럼 (hive 방식: month=2024-01/deal_type=매매/)
+PARTITION_COLUMNS = ['month', 'deal_type']
+
+# 사전 인코딩(범주형)으로 저장하는 문자열 컬럼
+DICTIONARY_COLUMNS = ['apartment', 'address', 'area_type', 'deal_type']
+
+# 읽어온 데이터의 컬럼 순서
+TRANSACTION_COLUMNS = ['date', 'apartment', 'address', 'area_type', 'deal_type', 'price', 'volume', 'rental_yield']
+
+
+class TransactionStore:
+    """거래 데이터를 파티션된 Parquet으로 저장하고 필요한 부분만 읽는 저장소"""
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+
+    def exists(self):
+        """저장된 데이터셋이 있는지 확인"""
+        if not os.path.isdir(self.root):
+            return False
+        for _, _, files in os.walk(self.root):
+            if any(name.endswith('.parquet') for name in files):
+                return True
+        return False
+
+    def prepare_frame(self, data):
+        """저장용 데이터프레임 정리 (날짜 타입, 월 파티션 컬럼, 범주형 문자열)"""
+        frame = data.copy()
+        frame['date'] = pd.to_datetime(frame['date'])
+        frame['month'] = frame['date'].dt.strftime('%Y-%m')
+
+        for column in DICTIONARY_COLUMNS:
+            if column in frame.columns and not isinstance(frame[column].dtype, pd.CategoricalDtype):
+                frame[column] = frame[column].astype('category')
+
+        return frame
+
+    def write(self, data, mode='overwrite'):
+        """데이터 저장
+
+        mode: 'overwrite' - 전체 교체, 'append' - 파일 추가,
+              'replace_partitions' - 새 데이터에 포함된 월/거래종류 파티션만 교체
+        """
+        if mode not in ('overwrite', 'append', 'replace_partitions'):
+            raise ValueError(f"지원하지 않는 저장 모드: {mode}")
+
+        if mode == 'overwrite' and os.path.isdir(self.root):
+            shutil.rmtree(self.root)
+
+        if data.empty:
+            return 0
+
+        frame = self.prepare_frame(data)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+
+        pq.write_to_dataset(
+            table,
+            self.root,
+            partition_cols=PARTITION_COLUMNS,
+            # 추가 저장 시 기존 파일과 이름이 겹치지 않도록 고유 파일명 사용
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior='delete_matching' if mode == 'replace_partitions' else 'overwrite_or_ignore'
+        )
+        return len(frame)
+
+    def write_batches(self, batches, mode='append'):
+        """데이터프레임 묶음을 받는 대로 저장 (전체 데이터를 메모리에 모으지 않음)
+
+        mode: 'overwrite' - 첫 묶음 저장 전 전체 삭제, 'append' - 기존 데이터에 추가,
+              'swap' - 임시 디렉터리에 모두 저장한 뒤 교체 (저장한 건이 없거나 실패하면 기존 데이터 유지)
+        (묶음마다 같은 파티션이 반복될 수 있어 'replace_partitions'는 지원하지 않음)
+        """
+        if mode not in ('overwrite', 'append', 'swap'):
+            raise ValueError(f"지원하지 않는 묶음 저장 모드: {mode}")
+
+        if mode == 'swap':
+            return self.swap_batches(batches)
+
+        if mode == 'overwrite' and os.path.isdir(self.root):
+            shutil.rmtree(self.root)
+
+        total = 0
+        for batch in batches:
+            total += self.write(batch, mode='append')
+        return total
+
+    def swap(self, data):
+        """새 데이터를 임시 디렉터리에 모두 저장한 뒤 디렉터리 이름 변경으로 교체
+
+        저장 중에는 이전 데이터를 그대로 읽을 수 있고, 이미 열린 파일은 교체 후에도 끝까지 읽힌다.
+        """
+        staging = self._create_staging()
+        try:
+            count = TransactionStore(staging).write(data, mode='append')
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self._promote(staging)
+        return count
+
+    def swap_batches(self, batches):
+        """데이터프레임 묶음을 임시 디렉터리에 저장한 뒤 교체 (저장한 건이 없거나 실패하면 기존 데이터 유지)"""
+        staging = self._create_staging()
+        try:
+            total = TransactionStore(staging).write_batches(batches, mode='append')
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if not total:
+            shutil.rmtree(staging, ignore_errors=True)
+            return 0
+
+        self._promote(staging)
+        return total
+
+    def _create_staging(self):
+        """저장소 옆에 임시 디렉터리 생성 (같은 파일 시스템이라 이름 변경으로 교체 가능)"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.root)), exist_ok=True)
+        staging = f"{self.root}.tmp-{uuid.uuid4().hex}"
+        os.makedirs(staging)
+        return staging
+
+    def _promote(self, staging):
+        """임시 디렉터리를 저장소 위치로 옮기고 이전 데이터 삭제"""
+        retired = f"{self.root}.old-{uuid.uuid4().hex}"
+        if os.path.isdir(self.root):
+            os.rename(self.root, retired)
+        os.rename(staging, self.root)
+        shutil.rmtree(retired, ignore_errors=True)
+
+    def last_months(self):
+        """아파트별 마지막으로 저장된 월 ('YYYY-MM')"""
+        if not self.exists():
+            return {}
+
+        # 파티션 컬럼과 아파트 컬럼만 읽기
+        table = pq.read_table(self.root, columns=['apartment', 'month'],
+                              read_dictionary=['apartment'], partitioning='hive')
+        frame = table.to_pandas()
+        frame['month'] = frame['month'].astype(str)
+        return frame.groupby('apartment', observed=True)['month'].max().to_dict()
+
+    def build_filters(self, apartments=None, deal_types=None, start_month=None, end_month=None):
+        """조건을 Parquet 필터(조건 푸시다운)로 변환"""
+        filters = []
+        if apartments is not None:
+            filters.append(('apartment', 'in', list(apartments)))
+        if deal_types is not None:
+            filters.append(('deal_type', 'in', list(deal_types)))
+        if start_month is not None:
+            filters.append(('month', '>=', start_month))
+        if end_month is not None:
+            filters.append(('month', '<=', end_month))
+        return filters or None
+
+    def load(self, columns=None, apartments=None, deal_types=None, start_month=None, end_month=None):
+        """필요한 컬럼과 조건의 데이터만 읽기 (메모리 매핑, 파티션/통계 기반 건너뛰기)"""
+        read_columns = None
+        if columns is not None:
+            read_columns = [column for column in columns if column != 'month']
+
+        table = pq.read_table(
+            self.root,
+            columns=read_columns,
+            filters=self.build_filters(apartments, deal_types, start_month, end_month),
+            memory_map=True,
+            read_dictionary=[column for column in DICTIONARY_COLUMNS if column not in PARTITION_COLUMNS],
+            partitioning='hive'
+        )
+
+        data = table.to_pandas()
+        if 'month' in data.columns and (columns is None or 'month' not in columns):
+            data = data.drop(columns='month')
+
+        # 파티션 컬럼이 끝으로 밀리지 않도록 원래 컬럼 순서로 정렬
+        ordered = [column for column in TRANSACTION_COLUMNS if column in data.columns]
+        data = data[ordered + [column for column in data.columns if column not in ordered]]
+
+        # 파티션별로 흩어진 행을 날짜순으로 정렬
+        if 'date' in data.columns:
+            data = data.sort_values('date', kind='mergesort').reset_index(drop=True)
+
+        return data